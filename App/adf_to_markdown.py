@@ -1,21 +1,46 @@
 import json
+import re
 from datetime import datetime
+from functools import lru_cache
+
+_ESCAPE_TABLE = str.maketrans({c: "\\" + c for c in "\\`*_{}[]()#+-|!>"})
+_SPECIALS_RE = re.compile(r"[\\`*_{}\[\]()#+\-|!>]")
+_BACKTICK_TABLE = str.maketrans({"`": "\\`"})
+_QUOTE_TABLE = str.maketrans({'"': '\\"'})
+_RE_TRAILING_WS = re.compile(r"[^\S\n]+(?=\n|\Z)")
+_RE_MULTIBLANK = re.compile(r"\n{3,}")
+
+class MarkdownOptions(dict):
+    """
+    Rendering options merged over the defaults. Build one per call site and reuse
+    it; normalize_description_to_markdown uses instances as-is instead of
+    re-merging a fresh dict on every call.
+    """
+
+    def __init__(self, **overrides):
+        super().__init__(
+            promote_strong_paragraphs_to_headings=True,
+            heading_level=2,
+            emoji_style="unicode",  # unicode or shortcode
+            list_indent_spaces=2,
+            escape_strategy="minimal",
+            ensure_trailing_newline=True,
+        )
+        self.update(overrides)
+
+_DEFAULT_OPTIONS = MarkdownOptions()
 
 def normalize_description_to_markdown(value, options=None):
     """
     Convert Jira Description (ADF or string) to Markdown.
     Returns a string (may be empty).
     """
-    opts = {
-        "promote_strong_paragraphs_to_headings": True,
-        "heading_level": 2,
-        "emoji_style": "unicode",  # unicode or shortcode
-        "list_indent_spaces": 2,
-        "escape_strategy": "minimal",
-        "ensure_trailing_newline": True
-    }
-    if options:
-        opts.update(options)
+    if options is None:
+        opts = _DEFAULT_OPTIONS
+    elif isinstance(options, MarkdownOptions):
+        opts = options
+    else:
+        opts = MarkdownOptions(**options)
 
     if value is None:
         return ""
@@ -36,102 +61,141 @@ def normalize_description_to_markdown(value, options=None):
         s = str(value)
     return s + ("\n" if opts["ensure_trailing_newline"] else "")
 
+class _MdWriter:
+    """Single output buffer for a run of blocks separated by one blank line."""
+
+    __slots__ = ("parts",)
+
+    def __init__(self):
+        self.parts = []
+
+    def block(self, text):
+        if self.parts:
+            self.parts.append("\n\n")
+        self.parts.append(text)
+
+    def getvalue(self):
+        return "".join(self.parts)
+
 def _adf_doc_to_markdown(doc, opts):
-    blocks = []
+    writer = _MdWriter()
     for node in doc.get("content", []) or []:
         block_md = _adf_block_to_markdown(node, opts, depth=0)
         if block_md:
-            blocks.append(block_md.rstrip())
-    out = "\n\n".join(b for b in blocks if b is not None)
-    out = _normalize_blank_lines(out)
+            writer.block(block_md.rstrip())
+    if opts.get("ensure_trailing_newline", True):
+        writer.parts.append("\n")
+    # Blank-line runs inside blocks (code, nested lists) are collapsed in one pass
+    out = _normalize_blank_lines(writer.getvalue())
     if opts.get("ensure_trailing_newline", True) and not out.endswith("\n"):
         out += "\n"
     return out
 
 def _adf_block_to_markdown(node, opts, depth):
-    t = node.get("type")
-    if t == "paragraph":
-        if opts.get("promote_strong_paragraphs_to_headings", True):
-            if _is_strong_only_paragraph(node):
-                text = _adf_inline_to_markdown(node.get("content", []) or [], opts)
-                level = min(max(int(opts.get("heading_level", 2)), 1), 6)
-                return "#" * level + " " + text.strip()
-        text = _adf_inline_to_markdown(node.get("content", []) or [], opts)
-        return text.strip()
-
-    if t == "heading":
-        level = min(max(node.get("attrs", {}).get("level", 2), 1), 6)
-        text = _adf_inline_to_markdown(node.get("content", []) or [], opts)
-        return "#" * level + " " + text.strip()
-
-    if t == "bulletList":
-        items = []
-        for li in node.get("content", []) or []:
-            items.extend(_adf_list_item(li, opts, ordered=False, depth=depth))
-        return "\n".join(items)
-
-    if t == "orderedList":
-        items = []
-        start = int(node.get("attrs", {}).get("order", 1) or 1)
-        for idx, li in enumerate(node.get("content", []) or []):
-            items.extend(_adf_list_item(li, opts, ordered=True, depth=depth, number=start + idx))
-        return "\n".join(items)
-
-    if t == "blockquote":
-        inner = []
-        for ch in node.get("content", []) or []:
-            b = _adf_block_to_markdown(ch, opts, depth)
-            if b:
-                lines = b.splitlines() or [""]
-                inner.append("\n".join(["> " + ln for ln in lines]))
-        return "\n\n".join(inner)
-
-    if t == "rule":
-        return "---"
-
-    if t == "codeBlock":
-        lang = node.get("attrs", {}).get("language")
-        code = _adf_text_from_inline(node.get("content", []) or [])
-        fence = "```"
-        header = fence + (lang if lang else "")
-        return f"{header}\n{code}\n{fence}"
-
-    if t == "panel":
-        panel_type = (node.get("attrs", {}) or {}).get("panelType")
-        label = f"[{panel_type}]" if panel_type else "[panel]"
-        inner_blocks = []
-        for ch in node.get("content", []) or []:
-            inner_blocks.append(_adf_block_to_markdown(ch, opts, depth))
-        inner = "\n\n".join([b for b in inner_blocks if b])
-        lines = (label + " " + inner).splitlines()
-        return "\n".join(["> " + ln for ln in lines])
-
-    if t in ("mediaSingle", "mediaGroup", "media"):
-        return "![attachment](attachment)"
-
-    if t == "table":
-        return _adf_table_to_markdown(node, opts)
-
-    if t == "taskList":
-        items = []
-        indent = " " * (opts.get("list_indent_spaces", 2) * depth)
-        for it in node.get("content", []) or []:
-            checked = (it.get("attrs", {}) or {}).get("state") == "DONE"
-            box = "[x]" if checked else "[ ]"
-            text = ""
-            for ch in it.get("content", []) or []:
-                if ch.get("type") == "paragraph":
-                    text = _adf_inline_to_markdown(ch.get("content", []) or [], opts).strip()
-            items.append(f"{indent}- {box} {text}")
-        return "\n".join(items)
-
+    handler = _BLOCK_HANDLERS.get(node.get("type"))
+    if handler is not None:
+        return handler(node, opts, depth)
     if "content" in node:
-        parts = []
+        writer = _MdWriter()
         for ch in node.get("content", []) or []:
-            parts.append(_adf_block_to_markdown(ch, opts, depth))
-        return "\n\n".join([p for p in parts if p])
+            block_md = _adf_block_to_markdown(ch, opts, depth)
+            if block_md:
+                writer.block(block_md)
+        return writer.getvalue()
     return ""
 
+def _block_paragraph(node, opts, depth):
+    if opts.get("promote_strong_paragraphs_to_headings", True):
+        if _is_strong_only_paragraph(node):
+            text = _adf_inline_to_markdown(node.get("content", []) or [], opts)
+            level = min(max(int(opts.get("heading_level", 2)), 1), 6)
+            return "#" * level + " " + text.strip()
+    text = _adf_inline_to_markdown(node.get("content", []) or [], opts)
+    return text.strip()
+
+def _block_heading(node, opts, depth):
+    level = min(max(node.get("attrs", {}).get("level", 2), 1), 6)
+    text = _adf_inline_to_markdown(node.get("content", []) or [], opts)
+    return "#" * level + " " + text.strip()
+
+def _block_bullet_list(node, opts, depth):
+    items = []
+    for li in node.get("content", []) or []:
+        items.extend(_adf_list_item(li, opts, ordered=False, depth=depth))
+    return "\n".join(items)
+
+def _block_ordered_list(node, opts, depth):
+    items = []
+    start = int(node.get("attrs", {}).get("order", 1) or 1)
+    for idx, li in enumerate(node.get("content", []) or []):
+        items.extend(_adf_list_item(li, opts, ordered=True, depth=depth, number=start + idx))
+    return "\n".join(items)
+
+def _block_blockquote(node, opts, depth):
+    inner = []
+    for ch in node.get("content", []) or []:
+        b = _adf_block_to_markdown(ch, opts, depth)
+        if b:
+            lines = b.splitlines() or [""]
+            inner.append("\n".join(["> " + ln for ln in lines]))
+    return "\n\n".join(inner)
+
+def _block_rule(node, opts, depth):
+    return "---"
+
+def _block_code(node, opts, depth):
+    lang = node.get("attrs", {}).get("language")
+    code = _adf_text_from_inline(node.get("content", []) or [])
+    fence = "```"
+    header = fence + (lang if lang else "")
+    return f"{header}\n{code}\n{fence}"
+
+def _block_panel(node, opts, depth):
+    panel_type = (node.get("attrs", {}) or {}).get("panelType")
+    label = f"[{panel_type}]" if panel_type else "[panel]"
+    writer = _MdWriter()
+    for ch in node.get("content", []) or []:
+        block_md = _adf_block_to_markdown(ch, opts, depth)
+        if block_md:
+            writer.block(block_md)
+    lines = (label + " " + writer.getvalue()).splitlines()
+    return "\n".join(["> " + ln for ln in lines])
+
+def _block_media(node, opts, depth):
+    return "![attachment](attachment)"
+
+def _block_table(node, opts, depth):
+    return _adf_table_to_markdown(node, opts)
+
+def _block_task_list(node, opts, depth):
+    items = []
+    indent = " " * (opts.get("list_indent_spaces", 2) * depth)
+    for it in node.get("content", []) or []:
+        checked = (it.get("attrs", {}) or {}).get("state") == "DONE"
+        box = "[x]" if checked else "[ ]"
+        text = ""
+        for ch in it.get("content", []) or []:
+            if ch.get("type") == "paragraph":
+                text = _adf_inline_to_markdown(ch.get("content", []) or [], opts).strip()
+        items.append(f"{indent}- {box} {text}")
+    return "\n".join(items)
+
+_BLOCK_HANDLERS = {
+    "paragraph": _block_paragraph,
+    "heading": _block_heading,
+    "bulletList": _block_bullet_list,
+    "orderedList": _block_ordered_list,
+    "blockquote": _block_blockquote,
+    "rule": _block_rule,
+    "codeBlock": _block_code,
+    "panel": _block_panel,
+    "mediaSingle": _block_media,
+    "mediaGroup": _block_media,
+    "media": _block_media,
+    "table": _block_table,
+    "taskList": _block_task_list,
+}
+
 def _adf_list_item(node, opts, ordered, depth, number=None):
     lines = []
     indent = " " * (opts.get("list_indent_spaces", 2) * depth)
@@ -164,108 +228,149 @@ def _adf_list_item(node, opts, ordered, depth, number=None):
 
 def _adf_inline_to_markdown(inlines, opts):
     out = []
+    append = out.append
+    get_handler = _INLINE_HANDLERS.get
     for node in inlines:
         t = node.get("type")
-        if t == "text":
-            text = node.get("text", "")
-            marks = node.get("marks", []) or []
-            out.append(_apply_marks(text, marks, opts))
-        elif t == "hardBreak":
-            out.append("\n")
-        elif t == "emoji":
-            out.append(_render_emoji(node.get("attrs", {}) or {}, opts))
-        elif t == "mention":
-            attrs = node.get("attrs", {}) or {}
-            label = attrs.get("text") or attrs.get("id") or "mention"
-            out.append("@" + label)
-        elif t in ("inlineCard", "blockCard"):
-            attrs = node.get("attrs", {}) or {}
-            url = attrs.get("url") or (attrs.get("data", {}) or {}).get("url")
-            if url:
-                title = (attrs.get("data", {}) or {}).get("name") or url
-                out.append(f"[{_escape_md(title)}]({url})")
-            else:
-                out.append("[card]")
-        elif t == "date":
-            attrs = node.get("attrs", {}) or {}
-            ts = attrs.get("timestamp")
-            if ts:
-                try:
-                    dt = datetime.fromtimestamp(int(ts) / 1000.0)
-                    out.append(dt.strftime("%Y-%m-%d"))
-                except Exception:
-                    out.append(_escape_md(str(ts)))
-            else:
-                out.append("[date]")
-        elif t == "status":
-            attrs = node.get("attrs", {}) or {}
-            txt = attrs.get("text") or ""
-            color = attrs.get("color")
-            if color:
-                out.append(f"[status: {_escape_md(txt)} ({color})]")
-            else:
-                out.append(f"[status: {_escape_md(txt)}]")
+        if t == "text" and not node.get("marks"):
+            # Unmarked text is the bulk of most documents; escape it directly
+            append(_escape_md(node.get("text", "")))
+            continue
+        handler = get_handler(t)
+        if handler is not None:
+            append(handler(node, opts))
         else:
-            out.append(_escape_md(str(node.get("text", ""))))
+            append(_escape_md(str(node.get("text", ""))))
     return "".join(out)
 
+def _inline_text(node, opts):
+    text = node.get("text", "")
+    marks = node.get("marks", []) or []
+    if not marks or not isinstance(text, str):
+        return _apply_marks(text, marks, opts)
+    # Marked runs (mentions, links, bold boilerplate) repeat a lot across
+    # comment threads, so render them once per (text, marks) shape.
+    return _render_marked_text(text, _marks_key(marks))
+
+def _marks_key(marks):
+    key = []
+    for m in marks:
+        attrs = m.get("attrs") or {}
+        key.append((m.get("type"), attrs.get("href"), attrs.get("title")))
+    return tuple(key)
+
+@lru_cache(maxsize=4096)
+def _render_marked_text(text, marks_key):
+    marks = [{"type": t, "attrs": {"href": href, "title": title}} for t, href, title in marks_key]
+    return _apply_marks(text, marks, None)
+
+def clear_render_cache():
+    """Drop memoized inline renderings (call between exports to bound memory)."""
+    _render_marked_text.cache_clear()
+
+def _inline_hard_break(node, opts):
+    return "\n"
+
+def _inline_emoji(node, opts):
+    return _render_emoji(node.get("attrs", {}) or {}, opts)
+
+def _inline_mention(node, opts):
+    attrs = node.get("attrs", {}) or {}
+    label = attrs.get("text") or attrs.get("id") or "mention"
+    return "@" + label
+
+def _inline_card(node, opts):
+    attrs = node.get("attrs", {}) or {}
+    url = attrs.get("url") or (attrs.get("data", {}) or {}).get("url")
+    if url:
+        title = (attrs.get("data", {}) or {}).get("name") or url
+        return f"[{_escape_md(title)}]({url})"
+    return "[card]"
+
+def _inline_date(node, opts):
+    attrs = node.get("attrs", {}) or {}
+    ts = attrs.get("timestamp")
+    if ts:
+        try:
+            dt = datetime.fromtimestamp(int(ts) / 1000.0)
+            return dt.strftime("%Y-%m-%d")
+        except Exception:
+            return _escape_md(str(ts))
+    return "[date]"
+
+def _inline_status(node, opts):
+    attrs = node.get("attrs", {}) or {}
+    txt = attrs.get("text") or ""
+    color = attrs.get("color")
+    if color:
+        return f"[status: {_escape_md(txt)} ({color})]"
+    return f"[status: {_escape_md(txt)}]"
+
+_INLINE_HANDLERS = {
+    "text": _inline_text,
+    "hardBreak": _inline_hard_break,
+    "emoji": _inline_emoji,
+    "mention": _inline_mention,
+    "inlineCard": _inline_card,
+    "blockCard": _inline_card,
+    "date": _inline_date,
+    "status": _inline_status,
+}
+
 def _is_strong_only_paragraph(node):
-    content = node.get("content", []) or []
-    if len(content) != 1 or content[0].get("type") != "text":
+    content = node.get("content")
+    if not content or len(content) != 1:
+        return False
+    only = content[0]
+    if only.get("type") != "text" or not only.get("text", "").strip():
         return False
-    marks = content[0].get("marks", []) or []
-    if not content[0].get("text", "").strip():
+    marks = only.get("marks")
+    if not marks:
         return False
-    return all(m.get("type") == "strong" for m in marks) and len(marks) >= 1
+    for m in marks:
+        if m.get("type") != "strong":
+            return False
+    return True
 
 def _apply_marks(text, marks, opts):
     if not marks:
         return _escape_md(text)
 
-    has_code = any(m.get("type") == "code" for m in marks)
-    if has_code:
+    types = {m.get("type") for m in marks}
+    if "code" in types:
         return f"`{_escape_backticks(text)}`"
 
-    wrapped = _escape_md(text)
-    types = [m.get("type") for m in marks if m.get("type")]
+    body = _escape_md(text)
     if "link" in types:
-        link_mark = next((m for m in marks if m.get("type") == "link"), None)
-        href = (link_mark.get("attrs") or {}).get("href") if link_mark else None
-        title = (link_mark.get("attrs") or {}).get("title") if link_mark else None
-        label = wrapped
+        link_mark = next(m for m in marks if m.get("type") == "link")
+        attrs = link_mark.get("attrs") or {}
+        href = attrs.get("href")
+        title = attrs.get("title")
         if href:
             if title:
-                wrapped = f"[{label}]({href} \"{_escape_quotes(title)}\")"
+                body = f"[{body}]({href} \"{_escape_quotes(title)}\")"
             else:
-                wrapped = f"[{label}]({href})"
-        types = [t for t in types if t != "link"]
-
-    if "strong" in types:
-        wrapped = f"**{wrapped}**"
-    if "em" in types:
-        wrapped = f"_{wrapped}_"
-    if "strike" in types:
-        wrapped = f"~~{wrapped}~~"
+                body = f"[{body}]({href})"
 
-    return wrapped
+    # Build the emphasis delimiters once instead of re-wrapping per mark
+    strong = "**" if "strong" in types else ""
+    em = "_" if "em" in types else ""
+    strike = "~~" if "strike" in types else ""
+    return f"{strike}{em}{strong}{body}{strong}{em}{strike}"
 
 def _escape_md(s):
     if not s:
         return ""
-    specials = "\\`*_{}[]()#+-|!>"
-    out = []
-    for ch in s:
-        if ch in specials:
-            out.append("\\" + ch)
-        else:
-            out.append(ch)
-    return "".join(out)
+    # Most prose has nothing to escape; skip building a translated copy
+    if not _SPECIALS_RE.search(s):
+        return s
+    return s.translate(_ESCAPE_TABLE)
 
 def _escape_backticks(s):
-    return s.replace("`", "\\`")
+    return s.translate(_BACKTICK_TABLE)
 
 def _escape_quotes(s):
-    return s.replace('"', '\\"')
+    return s.translate(_QUOTE_TABLE)
 
 def _render_emoji(attrs, opts):
     style = opts.get("emoji_style", "unicode")
@@ -286,19 +391,16 @@ def _render_emoji(attrs, opts):
     return txt if txt else "🙂"
 
 def _normalize_blank_lines(s):
-    lines = s.replace("\r\n", "\n").split("\n")
-    out = []
-    blank = False
-    for ln in lines:
-        ln = ln.rstrip()
-        if ln == "":
-            if not blank:
-                out.append("")
-            blank = True
-        else:
-            out.append(ln)
-            blank = False
-    return "\n".join(out)
+    # Strip trailing whitespace per line and collapse runs of blank lines to one.
+    s = _RE_TRAILING_WS.sub("", s.replace("\r\n", "\n"))
+    if not s.strip("\n"):
+        return ""
+    s = _RE_MULTIBLANK.sub("\n\n", s)
+    if s.startswith("\n\n"):
+        s = s[1:]
+    if s.endswith("\n\n"):
+        s = s[:-1]
+    return s
 
 def _adf_text_from_inline(inlines):
     parts = []
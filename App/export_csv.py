@@ -1,16 +1,49 @@
+import bisect
 import csv
-import threading
-from queue import Queue
+import heapq
+import pickle
+import tempfile
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
-from dateutil import parser as dtparser, tz
+from functools import lru_cache
+from dateutil import tz
+
+try:
+    from ciso8601 import parse_datetime as _parse_iso
+except ImportError:  # optional speedup; datetime.fromisoformat is the fallback
+    _parse_iso = datetime.fromisoformat
 
 CONCURRENT_WORKERS = 12  # keep default
+SPILL_CHUNK_SIZE = 2000  # issue records held in memory before a sorted run goes to disk
+ISSUE_BATCH_SIZE = 100  # issues fetched per search request
+
+@lru_cache(maxsize=16384)
+def parse_jira_datetime(s):
+    """
+    Parse a Jira timestamp. Jira emits ISO-8601 (e.g. 2024-01-31T09:15:00.000+0000,
+    or ...Z from the Agile API), which ciso8601 / datetime.fromisoformat handle far
+    faster than dateutil; anything else falls back to dtparser.parse.
+    """
+    try:
+        return _parse_iso(s)
+    except ValueError:
+        pass
+    # fromisoformat before 3.11 only takes the +HH:MM offset spelling
+    if s.endswith("Z"):
+        s = s[:-1] + "+00:00"
+    elif len(s) > 5 and s[-5] in "+-" and s[-4:].isdigit():
+        s = f"{s[:-2]}:{s[-2:]}"
+    try:
+        return datetime.fromisoformat(s)
+    except ValueError:
+        from dateutil import parser as dtparser  # only for non-ISO input
+        return dtparser.parse(s)
 
 def extract_status_changes(issue):
     changes = []
     histories = issue.get("changelog", {}).get("histories", [])
     for h in histories:
-        when = dtparser.parse(h.get("created"))
+        when = parse_jira_datetime(h.get("created"))
         for item in h.get("items", []):
             if item.get("field") == "status":
                 frm = item.get("fromString")
@@ -19,10 +52,10 @@ def extract_status_changes(issue):
     changes.sort(key=lambda x: x[2])
     return changes
 
-def compute_time_in_status(issue, bh_overlap_fn, bh_cfg=None):
+def compute_time_in_status(issue, bh_overlap_fn, bh_cfg=None, bh_overlap_batch_fn=None):
     changes = extract_status_changes(issue)
     fields = issue.get("fields", {})
-    created = dtparser.parse(fields.get("created")) if fields.get("created") else None
+    created = parse_jira_datetime(fields.get("created")) if fields.get("created") else None
     current_status = fields.get("status", {}).get("name")
     segments = []
     if changes:
@@ -36,40 +69,71 @@ def compute_time_in_status(issue, bh_overlap_fn, bh_cfg=None):
     else:
         if created and current_status:
             segments.append((current_status, created, datetime.now(tz=created.tzinfo or tz.UTC)))
+    segments = [seg for seg in segments if seg[0] and seg[1] and seg[2]]
+    if bh_cfg and bh_overlap_batch_fn:
+        # One call per issue: the business-hours config is resolved once for all segments
+        hours_list = bh_overlap_batch_fn([(s, e) for _, s, e in segments], bh_cfg)
+    elif bh_cfg and bh_overlap_fn:
+        hours_list = [bh_overlap_fn(s, e, bh_cfg) for _, s, e in segments]
+    else:
+        hours_list = [(e - s).total_seconds() / 3600.0 for _, s, e in segments]
     totals = {}
-    for status, s, e in segments:
-        if not status or not s or not e:
-            continue
-        hours = (e - s).total_seconds() / 3600.0
-        if bh_cfg and bh_overlap_fn:
-            hours = bh_overlap_fn(s, e, bh_cfg)
+    for (status, _, _), hours in zip(segments, hours_list):
         totals[status] = totals.get(status, 0.0) + max(0.0, hours)
     return totals
 
-def count_sequence_occurrences(changes, sequence):
+def compile_sequence(sequence):
+    """
+    Precompile a status sequence into its transition pairs plus a KMP failure
+    table, or None when the sequence is too short to describe a transition.
+    """
     if not sequence or len(sequence) < 2:
+        return None
+    pairs = [(sequence[k], sequence[k+1]) for k in range(len(sequence)-1)]
+    fail = [0] * len(pairs)
+    k = 0
+    for i in range(1, len(pairs)):
+        while k and pairs[i] != pairs[k]:
+            k = fail[k-1]
+        if pairs[i] == pairs[k]:
+            k += 1
+        fail[i] = k
+    return pairs, fail
+
+def count_compiled_occurrences(changes, compiled):
+    if compiled is None:
         return 0
+    pairs, fail = compiled
+    n_pairs = len(pairs)
     count = 0
-    i = 0
-    n = len(changes)
-    pair_index = 0
-    needed_pairs = [(sequence[k], sequence[k+1]) for k in range(len(sequence)-1)]
-    while i < n:
-        frm, to, when = changes[i]
-        need_from, need_to = needed_pairs[pair_index]
-        if frm == need_from and to == need_to:
-            pair_index += 1
-            if pair_index == len(needed_pairs):
+    matched = 0
+    for frm, to, _when in changes:
+        pair = (frm, to)
+        while matched and pair != pairs[matched]:
+            matched = fail[matched-1]
+        if pair == pairs[matched]:
+            matched += 1
+            if matched == n_pairs:
+                # Occurrences are counted without overlap
                 count += 1
-                pair_index = 0
-        else:
-            pair_index = 0
-            first_from, first_to = needed_pairs[0]
-            if frm == first_from and to == first_to:
-                pair_index = 1
-        i += 1
+                matched = 0
     return count
 
+def count_sequence_occurrences(changes, sequence):
+    return count_compiled_occurrences(changes, compile_sequence(sequence))
+
+def _adf_text_len(node):
+    if isinstance(node, dict):
+        if node.get("type") == "text":
+            return len(node.get("text", ""))
+        return sum(_adf_text_len(ch) for ch in node.get("content", []) or [])
+    return 0
+
+def _needs_full_comments(fields):
+    comments_block = fields.get("comment")
+    total_comments = (comments_block or {}).get("total")
+    return comments_block is None or total_comments is None or total_comments > len((comments_block or {}).get("comments", []))
+
 def get_comment_metrics(issue):
     comments = issue.get("fields", {}).get("comment", {}).get("comments", [])
     count = len(comments)
@@ -78,11 +142,9 @@ def get_comment_metrics(issue):
     for c in comments:
         body = c.get("body")
         if isinstance(body, dict) and "content" in body:
-            import json as _json
-            body_str = _json.dumps(body)
+            total_length += _adf_text_len(body)
         else:
-            body_str = str(body) if body is not None else ""
-        total_length += len(body_str)
+            total_length += len(str(body)) if body is not None else 0
         author = c.get("author", {}).get("displayName") or c.get("author", {}).get("accountId")
         if author:
             commenters.add(author)
@@ -92,83 +154,172 @@ def get_comment_metrics(issue):
         "commenter_count": len(commenters),
     }
 
-def export_csv(jira_client, jql, cfg, field_id_to_name, format_field_fn, business_hours_overlap, progress_cb):
+class _SortedRunSpool:
+    """
+    Collects per-issue records, spilling them to temp files in sorted runs so a
+    large export never holds every issue in memory. Iterating merges the runs
+    back in issue-key order.
+    """
+
+    def __init__(self, chunk_size=SPILL_CHUNK_SIZE):
+        self.chunk_size = chunk_size
+        self.buffer = []
+        self.run_files = []
+        self.seq = 0
+
+    def add(self, rec):
+        # Keep the in-memory run ordered as records arrive so neither a spill nor
+        # the final merge has to sort; seq keeps ties stable and avoids comparing dicts.
+        bisect.insort(self.buffer, (rec.get("key") or "", self.seq, rec))
+        self.seq += 1
+        if len(self.buffer) >= self.chunk_size:
+            self._spill()
+
+    def _spill(self):
+        f = tempfile.TemporaryFile()
+        for entry in self.buffer:
+            pickle.dump(entry, f, pickle.HIGHEST_PROTOCOL)
+        self.run_files.append(f)
+        self.buffer = []
+
+    @staticmethod
+    def _read_run(f):
+        try:
+            f.seek(0)
+            while True:
+                try:
+                    yield pickle.load(f)
+                except EOFError:
+                    return
+        finally:
+            f.close()
+
+    def __iter__(self):
+        runs = [self._read_run(f) for f in self.run_files]
+        runs.append(iter(self.buffer))
+        for _key, _seq, rec in heapq.merge(*runs):
+            yield rec
+
+def _error_record(key, exc):
+    return {
+        "key": key,
+        "fields": {},
+        "tr": {},
+        "cm": {},
+        "tis": {},
+        "error": str(exc)
+    }
+
+def compile_row_builder(sel_pairs, format_field_fn, formatter_for=None):
+    """
+    Generate build(fields) -> {column name: formatted value} for one export's
+    selected (field id, column name) pairs. The columns are unrolled into a
+    single dict literal, and with formatter_for(fid) each column's formatter
+    is bound once here instead of being looked up per cell.
+    """
+    ns = {"fmt": format_field_fn}
+    items = []
+    for i, (fid, name) in enumerate(sel_pairs):
+        if formatter_for is not None:
+            ns[f"f{i}"] = formatter_for(fid)
+            items.append(f"{name!r}: f{i}(get({fid!r}))")
+        else:
+            items.append(f"{name!r}: fmt({fid!r}, get({fid!r}))")
+    src = "def build(fields):\n    get = fields.get\n    return {" + ", ".join(items) + "}\n"
+    exec(compile(src, "<csv row builder>", "exec"), ns)
+    return ns["build"]
+
+def export_csv(jira_client, jql, cfg, field_id_to_name, format_field_fn, business_hours_overlap, progress_cb,
+               business_hours_overlap_batch=None, formatter_for=None):
     """
     progress_cb(stage: str, done: int, total: int)
+    formatter_for(fid), if given, returns the formatter format_field_fn would use for fid
     """
     # Stage 0: resolve keys
-    keys, _ = jira_client.search_jql(jql, max_results=100, fields=["key"], expand_changelog=False)
+    keys, _ = jira_client.search_jql(jql, fields=["key"], expand_changelog=False)
     total = len(keys)
 
-    q = Queue()
-    for key in keys:
-        q.put(key)
-    results = []
+    results = _SortedRunSpool()
     all_statuses = set()
-    lock = threading.Lock()
-    done_count = 0
 
     m = cfg.get("metrics", {})
     bh_cfg = cfg.get("business_hours", {})
     sel_ids = cfg.get("selected_field_ids") or cfg.get("selected_fields", [])
     trules = cfg.get("transition_rules", [])
+    compiled_rules = [(tr["name"], compile_sequence(tr.get("sequence", []))) for tr in trules]
+    sel_pairs = [(fid, field_id_to_name.get(fid, fid)) for fid in sel_ids]
+    build_row_fields = compile_row_builder(sel_pairs, format_field_fn, formatter_for)
+    need_cm = bool(m.get("comment_count") or m.get("comment_length") or m.get("commenter_count"))
+    need_tis = bool(m.get("time_in_status"))
 
     progress_cb("Stage 1/2: Downloading issues...", 0, total)
 
-    def worker():
-        nonlocal done_count
-        while True:
-            try:
-                key = q.get_nowait()
-            except Exception:
-                return
-            try:
+    # Only the fields the row actually uses are requested from the search
+    fetch_fields = list(dict.fromkeys(list(sel_ids) + ["status", "created", "comment"]))
+
+    def process(key, issue, full_comments=None):
+        try:
+            if issue is None:
                 issue = jira_client.get_issue(key, expand_changelog=True)
-                fields = issue.get("fields", {}) or {}
-
-                row_fields = {}
-                for fid in sel_ids:
-                    row_fields[field_id_to_name.get(fid, fid)] = format_field_fn(fid, fields.get(fid))
-
-                changes = extract_status_changes(issue)
-                tr_counts = {}
-                for tr in trules:
-                    seq = tr.get("sequence", [])
-                    tr_counts[tr["name"]] = count_sequence_occurrences(changes, seq)
-
-                cm = get_comment_metrics(issue) if m.get("comment_count") or m.get("comment_length") or m.get("commenter_count") else {}
-                tis = compute_time_in_status(issue, business_hours_overlap, bh_cfg) if m.get("time_in_status") else {}
-
-                with lock:
-                    if tis:
-                        all_statuses.update(tis.keys())
-                    results.append({
-                        "key": issue.get("key"),
-                        "fields": row_fields,
-                        "tr": tr_counts,
-                        "cm": cm,
-                        "tis": tis
-                    })
-                    done_count += 1
-            except Exception as e:
-                with lock:
-                    results.append({
-                        "key": key,
-                        "fields": {},
-                        "tr": {},
-                        "cm": {},
-                        "tis": {},
-                        "error": str(e)
-                    })
-                    done_count += 1
-            finally:
-                q.task_done()
-                progress_cb("Stage 1/2: Downloading issues...", done_count, total)
-
-    threads = [threading.Thread(target=worker, daemon=True) for _ in range(CONCURRENT_WORKERS)]
-    for t in threads:
-        t.start()
-    q.join()
+            fields = issue.get("fields", {}) or {}
+            # The issue payload only carries the first page of comments
+            if need_cm and _needs_full_comments(fields):
+                if full_comments is None:
+                    full_comments = jira_client.get_all_comments(key)
+                fields["comment"] = {"comments": full_comments, "total": len(full_comments)}
+
+            row_fields = build_row_fields(fields)
+
+            changes = extract_status_changes(issue)
+            tr_counts = {}
+            for name, compiled in compiled_rules:
+                tr_counts[name] = count_compiled_occurrences(changes, compiled)
+
+            cm = get_comment_metrics(issue) if need_cm else {}
+            tis = compute_time_in_status(issue, business_hours_overlap, bh_cfg,
+                                         business_hours_overlap_batch) if need_tis else {}
+
+            return {
+                "key": issue.get("key"),
+                "fields": row_fields,
+                "tr": tr_counts,
+                "cm": cm,
+                "tis": tis
+            }
+        except Exception as e:
+            return _error_record(key, e)
+
+    def fetch_and_process(batch):
+        try:
+            by_key = jira_client.get_issues_by_keys(batch, fields=fetch_fields, expand_changelog=True)
+        except Exception:
+            # One bad key (e.g. an issue deleted since the key search) fails the
+            # whole "key in (...)" search, so fetch this batch issue by issue
+            return [process(key, None) for key in batch]
+        comments = {}
+        if need_cm:
+            # Issues whose comments the search cut short get them all in one fan-out
+            short = [key for key, issue in by_key.items() if _needs_full_comments(issue.get("fields", {}) or {})]
+            if short:
+                try:
+                    comments = jira_client.get_comments_bulk(short, max_workers=4)
+                except Exception:
+                    pass  # process() retries each issue on its own
+        return [process(key, by_key.get(key), comments.get(key)) for key in batch]
+
+    # Results are gathered on this thread, so the workers share no state
+    batches = [keys[i:i + ISSUE_BATCH_SIZE] for i in range(0, total, ISSUE_BATCH_SIZE)]
+    done_count = 0
+    with ThreadPoolExecutor(max_workers=CONCURRENT_WORKERS) as executor:
+        futures = [executor.submit(fetch_and_process, batch) for batch in batches]
+        for fut in as_completed(futures):
+            recs = fut.result()
+            for rec in recs:
+                if rec["tis"]:
+                    all_statuses.update(rec["tis"].keys())
+                results.add(rec)
+            done_count += len(recs)
+            progress_cb("Stage 1/2: Downloading issues...", done_count, total)
 
     # Stage 2: Build CSV content in-memory and return it to caller to write
     progress_cb("Stage 2/2: Writing CSV...", 0, total)
@@ -181,13 +332,13 @@ def export_csv(jira_client, jql, cfg, field_id_to_name, format_field_fn, busines
     if m.get("comment_count"): headers.append("comment_count")
     if m.get("comment_length"): headers.append("comment_length")
     if m.get("commenter_count"): headers.append("commenter_count")
-    all_statuses_sorted = sorted(list(all_statuses))
+    all_statuses_sorted = sorted(all_statuses)
     if m.get("time_in_status"):
         headers.extend([f"TIS: {st}" for st in all_statuses_sorted])
 
     # Return a generator of rows so UI can stream-write and update progress
     def row_iter():
-        for idx, rec in enumerate(sorted(results, key=lambda r: r.get("key") or "")):
+        for idx, rec in enumerate(results):
             row = {"key": rec.get("key")}
             for name in sel_names:
                 row[name] = rec["fields"].get(name, "")
@@ -1,107 +1,187 @@
 import json
+import threading
+from queue import Queue
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from urllib.parse import quote
 from datetime import datetime
-from dateutil import parser as dtparser
-from adf_to_markdown import normalize_description_to_markdown
+from adf_to_markdown import MarkdownOptions, normalize_description_to_markdown, clear_render_cache
+from export_csv import CONCURRENT_WORKERS, ISSUE_BATCH_SIZE, _needs_full_comments, parse_jira_datetime
 
-def export_json(jira_client, jql, field_id_to_name, folder_path, progress_cb):
-    keys, _ = jira_client.search_jql(jql, max_results=100, fields=["key"], expand_changelog=False)
-    total = len(keys)
-    progress_cb("Exporting JSON...", 0, total)
+try:
+    import orjson
+except ImportError:  # optional speedup; fall back to the stdlib encoder
+    orjson = None
+
+DESCRIPTION_MD_OPTIONS = MarkdownOptions(
+    promote_strong_paragraphs_to_headings=True,
+    heading_level=2,
+    emoji_style="unicode",
+    list_indent_spaces=2,
+    escape_strategy="minimal",
+    ensure_trailing_newline=True
+)
+
+COMMENT_MD_OPTIONS = MarkdownOptions(
+    promote_strong_paragraphs_to_headings=False,  # Don't promote headings in comments
+    heading_level=4,  # Use smaller headings in comments
+    emoji_style="unicode",
+    list_indent_spaces=2,
+    escape_strategy="minimal",
+    ensure_trailing_newline=True
+)
 
-    for idx, key in enumerate(keys):
+def _fetch_issue(jira_client, key, issue=None, full_comments=None):
+    """Fetch an issue with its changelog (unless the batch search already returned it)
+    and make sure the comment list is complete."""
+    if issue is None:
         issue = jira_client.get_issue(key, expand_changelog=True)
 
-        fields = issue.get("fields", {}) or {}
-        comments_block = fields.get("comment")
-        total_comments = (comments_block or {}).get("total")
-        if comments_block is None or total_comments is None or total_comments > len((comments_block or {}).get("comments", [])):
+    fields = issue.get("fields", {}) or {}
+    if _needs_full_comments(fields):
+        if full_comments is None:
             full_comments = jira_client.get_all_comments(key)
-            fields["comment"] = {
-                "comments": full_comments,
-                "total": len(full_comments),
-                "maxResults": len(full_comments),
-                "startAt": 0,
-                "self": f"{jira_client.base_url}/rest/api/3/issue/{quote(key)}/comment"
-            }
-
-        # Description normalization for JSON metadata
-        desc_adf_or_text = fields.get("description")
-        desc_md = normalize_description_to_markdown(desc_adf_or_text, options={
-            "promote_strong_paragraphs_to_headings": True,
-            "heading_level": 2,
-            "emoji_style": "unicode",
-            "list_indent_spaces": 2,
-            "escape_strategy": "minimal",
-            "ensure_trailing_newline": True
-        })
-
-        transformed_fields = {}
-        for fid, value in fields.items():
-            disp = field_id_to_name.get(fid, fid)
-            if fid == "description":
-                transformed_fields["description_raw"] = value
-                transformed_fields["description_markdown"] = desc_md
-            else:
-                transformed_fields[disp] = value
-
-        out = {
-            "key": issue.get("key"),
-            "id": issue.get("id"),
-            "self": issue.get("self"),
-            "fields": transformed_fields,
-            "changelog": issue.get("changelog"),
-            "meta": {
-                "fieldIdMap": field_id_to_name
-            }
+        fields["comment"] = {
+            "comments": full_comments,
+            "total": len(full_comments),
+            "maxResults": len(full_comments),
+            "startAt": 0,
+            "self": f"{jira_client.base_url}/rest/api/3/issue/{quote(key)}/comment"
         }
+    return issue, fields
 
-        # Save JSON file only
-        out_path = f"{folder_path}/{key}.json"
-        with open(out_path, "w", encoding="utf-8") as f:
-            json.dump(out, f, indent=2, ensure_ascii=False)
+def _export_issue_json(jira_client, key, issue, full_comments, field_id_to_name, folder_path):
+    issue, fields = _fetch_issue(jira_client, key, issue, full_comments)
 
-        progress_cb("Exporting JSON...", idx + 1, total)
+    # Description normalization for JSON metadata
+    desc_adf_or_text = fields.get("description")
+    desc_md = normalize_description_to_markdown(desc_adf_or_text, options=DESCRIPTION_MD_OPTIONS)
 
-def export_markdown(jira_client, jql, field_id_to_name, folder_path, progress_cb):
-    keys, _ = jira_client.search_jql(jql, max_results=100, fields=["key"], expand_changelog=False)
+    transformed_fields = {}
+    for fid, value in fields.items():
+        disp = field_id_to_name.get(fid, fid)
+        if fid == "description":
+            transformed_fields["description_raw"] = value
+            transformed_fields["description_markdown"] = desc_md
+        else:
+            transformed_fields[disp] = value
+
+    out = {
+        "key": issue.get("key"),
+        "id": issue.get("id"),
+        "self": issue.get("self"),
+        "fields": transformed_fields,
+        "changelog": issue.get("changelog"),
+        "meta": {
+            "fieldIdMap": field_id_to_name
+        }
+    }
+
+    # JSON file only; the writer thread puts it on disk
+    out_path = f"{folder_path}/{key}.json"
+    if orjson is not None:
+        return out_path, orjson.dumps(out, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return out_path, json.dumps(out, indent=2, ensure_ascii=False)
+
+def _export_issue_markdown(jira_client, key, issue, full_comments, field_id_to_name, folder_path):
+    issue, fields = _fetch_issue(jira_client, key, issue, full_comments)
+
+    # Description normalization
+    desc_adf_or_text = fields.get("description")
+    desc_md = normalize_description_to_markdown(desc_adf_or_text, options=DESCRIPTION_MD_OPTIONS)
+
+    # Markdown file only; the writer thread puts it on disk
+    markdown_content = create_markdown_content(issue, fields, field_id_to_name, desc_md)
+    md_path = f"{folder_path}/{key}.md"
+    return md_path, markdown_content
+
+def _start_writer(writer_q, errors):
+    """
+    Drain (path, data) items from writer_q onto disk until a None sentinel arrives.
+    bytes are written as-is, str as UTF-8 text. The first failure is kept in
+    errors and later items are dropped.
+    """
+    def _writer():
+        while True:
+            item = writer_q.get()
+            try:
+                if item is None:
+                    return
+                if errors:
+                    continue
+                path, data = item
+                if isinstance(data, bytes):
+                    with open(path, "wb") as f:
+                        f.write(data)
+                else:
+                    with open(path, "w", encoding="utf-8") as f:
+                        f.write(data)
+            except Exception as e:
+                errors.append(e)
+            finally:
+                writer_q.task_done()
+
+    t = threading.Thread(target=_writer, name="export-writer", daemon=True)
+    t.start()
+    return t
+
+def _export_issues(export_one, jira_client, jql, field_id_to_name, folder_path, stage, progress_cb):
+    keys, _ = jira_client.search_jql(jql, fields=["key"], expand_changelog=False)
     total = len(keys)
-    progress_cb("Exporting Markdown...", 0, total)
+    progress_cb(stage, 0, total)
+    clear_render_cache()
 
-    for idx, key in enumerate(keys):
-        issue = jira_client.get_issue(key, expand_changelog=True)
+    # Workers only fetch and render; a single writer thread does the disk I/O.
+    # The bounded queue holds workers back if the disk falls behind.
+    writer_q = Queue(maxsize=32)
+    write_errors = []
+    writer = _start_writer(writer_q, write_errors)
 
-        fields = issue.get("fields", {}) or {}
-        comments_block = fields.get("comment")
-        total_comments = (comments_block or {}).get("total")
-        if comments_block is None or total_comments is None or total_comments > len((comments_block or {}).get("comments", [])):
-            full_comments = jira_client.get_all_comments(key)
-            fields["comment"] = {
-                "comments": full_comments,
-                "total": len(full_comments),
-                "maxResults": len(full_comments),
-                "startAt": 0,
-                "self": f"{jira_client.base_url}/rest/api/3/issue/{quote(key)}/comment"
-            }
-
-        # Description normalization
-        desc_adf_or_text = fields.get("description")
-        desc_md = normalize_description_to_markdown(desc_adf_or_text, options={
-            "promote_strong_paragraphs_to_headings": True,
-            "heading_level": 2,
-            "emoji_style": "unicode",
-            "list_indent_spaces": 2,
-            "escape_strategy": "minimal",
-            "ensure_trailing_newline": True
-        })
-
-        # Create and save Markdown file only
-        markdown_content = create_markdown_content(issue, fields, field_id_to_name, desc_md)
-        md_path = f"{folder_path}/{key}.md"
-        with open(md_path, "w", encoding="utf-8") as f:
-            f.write(markdown_content)
-
-        progress_cb("Exporting Markdown...", idx + 1, total)
+    def export_batch(batch):
+        # One search request brings back the whole batch with changelogs
+        try:
+            by_key = jira_client.get_issues_by_keys(batch, expand_changelog=True)
+        except Exception:
+            # One bad key (e.g. an issue deleted since the key search) fails the
+            # whole "key in (...)" search, so export_one fetches each issue itself
+            by_key = {}
+        # Issues whose comments the search cut short get them all in one fan-out
+        short = [key for key, issue in by_key.items() if _needs_full_comments(issue.get("fields", {}) or {})]
+        comments = jira_client.get_comments_bulk(short, max_workers=4) if short else {}
+        for key in batch:
+            writer_q.put(export_one(jira_client, key, by_key.get(key), comments.get(key),
+                                    field_id_to_name, folder_path))
+        return len(batch)
+
+    # Each batch is an independent fetch + file writes, so run them side by side
+    batches = [keys[i:i + ISSUE_BATCH_SIZE] for i in range(0, total, ISSUE_BATCH_SIZE)]
+    done = 0
+    try:
+        with ThreadPoolExecutor(max_workers=CONCURRENT_WORKERS) as executor:
+            futures = [executor.submit(export_batch, batch) for batch in batches]
+            try:
+                for fut in as_completed(futures):
+                    done += fut.result()
+                    if write_errors:
+                        raise write_errors[0]
+                    progress_cb(stage, done, total)
+            except Exception:
+                for fut in futures:
+                    fut.cancel()
+                raise
+    finally:
+        # Every worker has finished by now, so the sentinel is the last item
+        writer_q.put(None)
+        writer.join()
+    if write_errors:
+        raise write_errors[0]
+
+def export_json(jira_client, jql, field_id_to_name, folder_path, progress_cb):
+    _export_issues(_export_issue_json, jira_client, jql, field_id_to_name, folder_path,
+                   "Exporting JSON...", progress_cb)
+
+def export_markdown(jira_client, jql, field_id_to_name, folder_path, progress_cb):
+    _export_issues(_export_issue_markdown, jira_client, jql, field_id_to_name, folder_path,
+                   "Exporting Markdown...", progress_cb)
 
 def create_markdown_content(issue, fields, field_id_to_name, description_md):
     """Create markdown content for an issue"""
@@ -216,7 +296,7 @@ def create_markdown_content(issue, fields, field_id_to_name, description_md):
             created_str = comment.get("created", "")
             try:
                 if created_str:
-                    created_dt = dtparser.parse(created_str)
+                    created_dt = parse_jira_datetime(created_str)
                     date_str = created_dt.strftime("%Y-%m-%d")
                     time_str = created_dt.strftime("%H:%M")
                 else:
@@ -232,14 +312,7 @@ def create_markdown_content(issue, fields, field_id_to_name, description_md):
             
             # Convert comment body to markdown
             comment_body = comment.get("body")
-            comment_md = normalize_description_to_markdown(comment_body, options={
-                "promote_strong_paragraphs_to_headings": False,  # Don't promote headings in comments
-                "heading_level": 4,  # Use smaller headings in comments
-                "emoji_style": "unicode",
-                "list_indent_spaces": 2,
-                "escape_strategy": "minimal",
-                "ensure_trailing_newline": True
-            })
+            comment_md = normalize_description_to_markdown(comment_body, options=COMMENT_MD_OPTIONS)
             
             if comment_md.strip():
                 # Clean up the markdown formatting
@@ -1,12 +1,113 @@
+import random
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.request import getproxies
 import requests
+from requests.adapters import HTTPAdapter
+
+try:
+    import orjson
+except ImportError:  # optional speedup; fall back to the stdlib decoder
+    orjson = None
+
+try:
+    # Optional: with httpx + h2 installed, concurrent requests share one
+    # multiplexed HTTP/2 connection instead of one TLS connection each
+    import httpx
+    import h2  # noqa: F401  (httpx needs it for http2=True)
+except ImportError:
+    httpx = None
+
+PAGE_WORKERS = 8  # concurrent page requests for startAt/total paginated endpoints
+POOL_MAXSIZE = 32  # keep-alive connections to the Jira host (requests transport)
+METADATA_TTL = 600  # seconds to reuse field/project/status metadata before refetching
+KEY_PAGE_SIZE = 5000  # /search/jql page size for key-only searches; the server caps it and nextPageToken continues
+
+# Connection pools shared by every JiraClient in the process. Credentials stay
+# on each client's session, so a re-login, a reconnect or a second saved
+# connection to the same host reuses the warm TLS connections
+_transport_lock = threading.Lock()
+_shared_transports = {}
+
+if httpx is not None:
+    class _SharedHTTPTransport(httpx.HTTPTransport):
+        """The process-wide httpx pool; closing one client must not close it for the others"""
+        def close(self):
+            pass
+
+def _shared_transport(kind):
+    with _transport_lock:
+        transport = _shared_transports.get(kind)
+        if transport is None:
+            if kind == "httpx":
+                transport = _SharedHTTPTransport(
+                    http2=True,
+                    limits=httpx.Limits(max_keepalive_connections=20, max_connections=20),
+                )
+            else:
+                # The default pool keeps only 10 sockets per host, fewer than the export
+                # and pagination workers use, so extra connections were opened and dropped
+                transport = HTTPAdapter(pool_connections=4, pool_maxsize=POOL_MAXSIZE, pool_block=False)
+            _shared_transports[kind] = transport
+        return transport
+
+def _json(r):
+    """Decode a response body, with orjson straight from the raw bytes when available"""
+    if orjson is not None:
+        return orjson.loads(r.content)
+    return r.json()
+
+def _retry_delay(client, method, r, attempt):
+    """
+    Seconds to wait before retrying response r, or None if it shouldn't be
+    retried: 429s always, 5xx only for GETs, at most client.max_retries times.
+    """
+    retryable = r.status_code == 429 or (method == "GET" and 500 <= r.status_code < 600)
+    if not retryable or attempt >= client.max_retries:
+        return None
+    if r.status_code == 429:
+        try:
+            return min(client.backoff_cap, max(0.0, float(r.headers.get("Retry-After"))))
+        except (TypeError, ValueError):
+            pass
+    return random.uniform(0, min(client.backoff_cap, client.backoff_base * 2 ** attempt))
 
 class JiraClient:
-    def __init__(self, base_url, email, api_token, log_fn=lambda msg: None):
+    def __init__(self, base_url, email, api_token, log_fn=lambda msg: None,
+                 max_retries=3, backoff_base=1.0, backoff_cap=30.0, session=None):
         self.base_url = base_url.rstrip("/")
-        self.session = requests.Session()
-        self.session.auth = (email, api_token)
+        self.auth = (email, api_token)
+        if session is None:
+            session = self._make_session()
+        else:
+            # A caller's session keeps its own transport setup but must send this client's credentials
+            session.auth = self.auth
+        self.session = session
         self.log = log_fn
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_cap = backoff_cap
+        self._cache = {}  # (method, args) -> (fetched_at, value)
+        self._validators = {}  # (url, params) -> (etag, last_modified, decoded body)
+
+    def _make_session(self):
+        if httpx is not None:
+            if getproxies():
+                # An explicit transport makes httpx skip HTTP(S)_PROXY/NO_PROXY, so
+                # behind a proxy the client keeps httpx's own environment setup
+                return httpx.Client(auth=self.auth, follow_redirects=True, http2=True)
+            return httpx.Client(
+                auth=self.auth,
+                follow_redirects=True,
+                transport=_shared_transport("httpx"),
+            )
+        session = requests.Session()
+        session.auth = self.auth
+        adapter = _shared_transport("requests")
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
 
     def test_connection(self):
         try:
@@ -16,229 +117,170 @@ class JiraClient:
         except Exception:
             return False
 
-    def get_fields(self):
+    def get_fields(self, refresh=False):
+        return self._cached(("fields",), self._fetch_fields, refresh)
+
+    def _fetch_fields(self):
         url = f"{self.base_url}/rest/api/3/field"
-        r = self.session.get(url, timeout=30)
-        r.raise_for_status()
-        return r.json()
+        return self._get_json(url, None, 30, conditional=True)
 
     def get_issue(self, key, expand_changelog=True):
         url = f"{self.base_url}/rest/api/3/issue/{key}"
         params = {}
         if expand_changelog:
             params["expand"] = "changelog"
-        r = self.session.get(url, params=params, timeout=60)
-        if r.status_code == 429:
-            retry_after = int(r.headers.get("Retry-After", "2"))
-            time.sleep(min(10, max(1, retry_after)))
-            r = self.session.get(url, params=params, timeout=60)
+        r = self._request("GET", url, params=params, timeout=60)
         r.raise_for_status()
-        return r.json()
+        return _json(r)
+
+    def search_jql(self, jql, max_results=KEY_PAGE_SIZE, fields=None, expand_changelog=False):
+        """
+        Return the keys of every issue matching jql, and their count.
+
+        Only keys come back, so no fields or changelog are requested unless the
+        caller names specific fields; use search_issues for full issues.
+        """
+        if fields is None:
+            fields = ["id"]  # smallest payload /search/jql offers; the key is always included
+        issue_keys = [issue["key"] for issue in self._iter_search(jql, max_results, fields, False)]
+        # Return total count - for the new API, we need to count the issues we got
+        return issue_keys, len(issue_keys)
+
+    def search_issues(self, jql, max_results=100, fields=None, expand_changelog=False):
+        """Run a JQL search and return the full issue objects instead of only their keys"""
+        return list(self._iter_search(jql, max_results, fields, expand_changelog))
+
+    def get_issues_by_keys(self, keys, fields=None, expand_changelog=True):
+        """Fetch a batch of issues with one search request instead of one GET per key
 
-    def search_jql(self, jql, max_results=50, fields=None, expand_changelog=False):
+        Returns a dict of key -> issue; issues whose changelog the search truncated
+        are re-fetched individually with get_issue. A key that no longer exists
+        (e.g. a deleted issue) makes Jira reject the whole search, so the
+        request error propagates and callers should fall back to get_issue per key.
+        """
+        if not keys:
+            return {}
+        if fields is None:
+            fields = ["*all"]  # match get_issue, which returns every field
+        jql = "key in ({})".format(", ".join(f'"{k}"' for k in keys))
+        by_key = {}
+        truncated = []
+        for issue in self.search_issues(jql, max_results=len(keys), fields=fields, expand_changelog=expand_changelog):
+            changelog = issue.get("changelog") or {}
+            if expand_changelog and changelog.get("total", 0) > len(changelog.get("histories", [])):
+                truncated.append(issue["key"])
+            by_key[issue["key"]] = issue
+        if truncated:
+            by_key.update(self.get_issues(truncated, expand_changelog=True, max_workers=4))
+        return by_key
+
+    def get_issues(self, keys, expand_changelog=True, max_workers=10):
+        """Fetch several issues with get_issue side by side; returns {key: issue}"""
+        return self._fan_out(lambda key: self.get_issue(key, expand_changelog=expand_changelog), keys, max_workers)
+
+    def get_comments_bulk(self, keys, max_workers=10):
+        """Fetch the full comment list of several issues side by side; returns {key: [comments]}"""
+        return self._fan_out(self.get_all_comments, keys, max_workers)
+
+    def _iter_search(self, jql, max_results, fields, expand_changelog):
         url = f"{self.base_url}/rest/api/3/search/jql"
-        issue_keys = []
-        next_page_token = None
         
-        # Build expand list
-        expand_list = []
-        if expand_changelog:
-            expand_list.append("changelog")
+        # Everything but the page token is the same on every request, so the
+        # payload is built once and only the token is swapped in per page
+        base_payload = {
+            "jql": jql,
+            "maxResults": max_results
+        }
         
-        # Convert expand list to comma-separated string if not empty
-        expand_str = ",".join(expand_list) if expand_list else None
+        # Add optional parameters only if they have values
+        if fields is not None:
+            base_payload["fields"] = fields
         
-        while True:
-            # Build payload according to the new API specification
-            payload = {
-                "jql": jql,
-                "maxResults": max_results
-            }
-            
-            # Add optional parameters only if they have values
-            if fields is not None:
-                payload["fields"] = fields
-            
-            if expand_str:
-                payload["expand"] = expand_str
-            
+        if expand_changelog:
+            base_payload["expand"] = "changelog"
+        
+        def fetch_page(next_page_token):
+            payload = base_payload
             if next_page_token:
-                payload["nextPageToken"] = next_page_token
+                payload = dict(base_payload, nextPageToken=next_page_token)
             
-            r = self.session.post(url, json=payload, timeout=60)
-            if r.status_code == 429:
-                retry_after = int(r.headers.get("Retry-After", "2"))
-                time.sleep(min(10, max(1, retry_after)))
-                r = self.session.post(url, json=payload, timeout=60)
+            r = self._request("POST", url, json=payload, timeout=60)
             r.raise_for_status()
-            data = r.json()
-            
-            # Extract issues from response
-            for issue in data.get("issues", []):
-                issue_keys.append(issue["key"])
-            
-            # Check if there are more pages (new pagination model)
-            if data.get("isLast", True):
-                break
-            
-            # The new API doesn't use startAt/total, it uses nextPageToken
-            # But if nextPageToken is not provided, break to avoid infinite loop
-            next_page_token = data.get("nextPageToken")
-            if not next_page_token:
-                break
-        
-        # Return total count - for the new API, we need to count the issues we got
-        return issue_keys, len(issue_keys)
+            return _json(r)
+
+        # The page token is opaque, so pages stay serial; the next page is
+        # requested in the background while the caller consumes this one
+        with ThreadPoolExecutor(max_workers=1) as prefetcher:
+            data = fetch_page(None)
+            while True:
+                # Check if there are more pages (new pagination model)
+                # The new API doesn't use startAt/total, it uses nextPageToken
+                # But if nextPageToken is not provided, stop to avoid an infinite loop
+                next_page_token = None if data.get("isLast", True) else data.get("nextPageToken")
+                pending = prefetcher.submit(fetch_page, next_page_token) if next_page_token else None
+                
+                # Extract issues from response
+                yield from data.get("issues", [])
+                
+                if pending is None:
+                    break
+                data = pending.result()
 
     def get_all_comments(self, issue_key):
+        return list(self.iter_comments(issue_key))
+
+    def iter_comments(self, issue_key):
+        """Yield an issue's comments page by page; stop early to skip the remaining pages"""
         url = f"{self.base_url}/rest/api/3/issue/{issue_key}/comment"
-        start_at = 0
-        all_comments = []
-        while True:
-            params = {"startAt": start_at, "maxResults": 100}
-            r = self.session.get(url, params=params, timeout=60)
-            if r.status_code == 429:
-                retry_after = int(r.headers.get("Retry-After", "2"))
-                time.sleep(min(10, max(1, retry_after)))
-                r = self.session.get(url, params=params, timeout=60)
-            r.raise_for_status()
-            data = r.json()
-            comments = data.get("comments", [])
-            all_comments.extend(comments)
-            if start_at + data.get("maxResults", 0) >= data.get("total", 0):
-                break
-            start_at += data.get("maxResults", 0)
-        return all_comments
+        return self._paginate(url, {}, "comments", max_results=100, timeout=60, step_by_items=True)
 
     def get_all_boards(self):
         """Get all boards the user has access to"""
         url = f"{self.base_url}/rest/agile/1.0/board"
-        all_boards = []
-        start_at = 0
-        max_results = 50
-        
-        while True:
-            params = {
-                "startAt": start_at,
-                "maxResults": max_results
-            }
-            r = self.session.get(url, params=params, timeout=30)
-            if r.status_code == 429:
-                retry_after = int(r.headers.get("Retry-After", "2"))
-                time.sleep(min(10, max(1, retry_after)))
-                r = self.session.get(url, params=params, timeout=30)
-            r.raise_for_status()
-            data = r.json()
-            boards = data.get("values", [])
-            all_boards.extend(boards)
-            if data.get("isLast", True):
-                break
-            start_at += max_results
-        return all_boards
+        return list(self._paginate(url, {}, "values", max_results=50, timeout=30))
 
     def get_board_sprints(self, board_id, state=None):
         """Get all sprints for a board"""
         url = f"{self.base_url}/rest/agile/1.0/board/{board_id}/sprint"
-        all_sprints = []
-        start_at = 0
-        max_results = 50
-        
-        while True:
-            params = {
-                "startAt": start_at,
-                "maxResults": max_results
-            }
-            if state:
-                params["state"] = state
-            
-            r = self.session.get(url, params=params, timeout=30)
-            if r.status_code == 429:
-                retry_after = int(r.headers.get("Retry-After", "2"))
-                time.sleep(min(10, max(1, retry_after)))
-                r = self.session.get(url, params=params, timeout=30)
-            r.raise_for_status()
-            data = r.json()
-            sprints = data.get("values", [])
-            all_sprints.extend(sprints)
-            if data.get("isLast", True):
-                break
-            start_at += max_results
-        return all_sprints
+        params = {}
+        if state:
+            params["state"] = state
+        return list(self._paginate(url, params, "values", max_results=50, timeout=30))
 
     def get_sprint(self, sprint_id):
         """Get sprint details including start and end dates"""
         url = f"{self.base_url}/rest/agile/1.0/sprint/{sprint_id}"
-        r = self.session.get(url, timeout=30)
-        if r.status_code == 429:
-            retry_after = int(r.headers.get("Retry-After", "2"))
-            time.sleep(min(10, max(1, retry_after)))
-            r = self.session.get(url, timeout=30)
+        r = self._request("GET", url, timeout=30)
         r.raise_for_status()
-        return r.json()
+        return _json(r)
 
     def get_sprint_issues(self, sprint_id):
         """Get all issues in a sprint"""
+        return list(self.iter_sprint_issues(sprint_id))
+
+    def iter_sprint_issues(self, sprint_id):
+        """Yield the issues in a sprint (with changelog) as each page arrives"""
         url = f"{self.base_url}/rest/agile/1.0/sprint/{sprint_id}/issue"
-        all_issues = []
-        start_at = 0
-        max_results = 50
-        
-        while True:
-            params = {
-                "startAt": start_at,
-                "maxResults": max_results,
-                "expand": "changelog"
-            }
-            r = self.session.get(url, params=params, timeout=60)
-            if r.status_code == 429:
-                retry_after = int(r.headers.get("Retry-After", "2"))
-                time.sleep(min(10, max(1, retry_after)))
-                r = self.session.get(url, params=params, timeout=60)
-            r.raise_for_status()
-            data = r.json()
-            issues = data.get("issues", [])
-            all_issues.extend(issues)
-            if start_at + data.get("maxResults", 0) >= data.get("total", 0):
-                break
-            start_at += data.get("maxResults", 0)
-        return all_issues
-
-    def get_all_projects(self):
+        return self._paginate(url, {"expand": "changelog"}, "issues", max_results=50, timeout=60)
+
+    def get_all_projects(self, refresh=False):
         """Get all projects the user has access to"""
+        return self._cached(("projects",), self._fetch_all_projects, refresh)
+
+    def _fetch_all_projects(self):
         url = f"{self.base_url}/rest/api/3/project/search"
-        all_projects = []
-        start_at = 0
-        max_results = 50
-        
-        while True:
-            params = {
-                "startAt": start_at,
-                "maxResults": max_results
-            }
-            r = self.session.get(url, params=params, timeout=30)
-            if r.status_code == 429:
-                retry_after = int(r.headers.get("Retry-After", "2"))
-                time.sleep(min(10, max(1, retry_after)))
-                r = self.session.get(url, params=params, timeout=30)
-            r.raise_for_status()
-            data = r.json()
-            projects = data.get("values", [])
-            all_projects.extend(projects)
-            if data.get("isLast", True):
-                break
-            start_at += max_results
-        return all_projects
-
-    def get_project_statuses(self, project_key):
+        return list(self._paginate(url, {}, "values", max_results=50, timeout=30, conditional=True))
+
+    def get_project_statuses(self, project_key, refresh=False):
         """Get all statuses available for a project"""
+        return self._cached(("project_statuses", project_key),
+                            lambda: self._fetch_project_statuses(project_key), refresh)
+
+    def _fetch_project_statuses(self, project_key):
         url = f"{self.base_url}/rest/api/3/project/{project_key}/statuses"
-        r = self.session.get(url, timeout=30)
-        if r.status_code == 429:
-            retry_after = int(r.headers.get("Retry-After", "2"))
-            time.sleep(min(10, max(1, retry_after)))
-            r = self.session.get(url, timeout=30)
+        r = self._request("GET", url, timeout=30)
         r.raise_for_status()
-        data = r.json()
+        data = _json(r)
         
         # Extract unique status names across all issue types
         statuses = set()
@@ -246,4 +288,138 @@ class JiraClient:
             for status in issue_type.get("statuses", []):
                 statuses.add(status.get("name"))
         
-        return sorted(list(statuses))
\ No newline at end of file
+        return sorted(list(statuses))
+
+    def _fan_out(self, fetch, keys, max_workers):
+        # Each call keeps its own 429 backoff via _request, so a throttled
+        # request only delays its own worker
+        keys = list(dict.fromkeys(keys))
+        if len(keys) <= 1:
+            return {key: fetch(key) for key in keys}
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(keys))) as executor:
+            return dict(zip(keys, executor.map(fetch, keys)))
+
+    def _cached(self, key, fetch, refresh=False):
+        """
+        Return a cached metadata list younger than METADATA_TTL, otherwise fetch
+        and cache it. refresh=True always refetches. Callers get their own copy
+        of the list so the cached one can't be modified.
+        """
+        now = time.monotonic()
+        hit = self._cache.get(key)
+        if hit is None or refresh or now - hit[0] >= METADATA_TTL:
+            hit = (now, fetch())
+            self._cache[key] = hit
+        return list(hit[1])
+
+    def _request(self, method, url, **kwargs):
+        """
+        Send a request, retrying rate-limited (429) responses and, for GETs,
+        transient 5xx errors with exponential backoff and full jitter. A
+        Retry-After header from Jira takes precedence over the computed delay.
+        The last response is returned either way; callers raise_for_status.
+        """
+        attempt = 0
+        while True:
+            r = self.session.request(method, url, **kwargs)
+            delay = _retry_delay(self, method, r, attempt)
+            if delay is None:
+                return r
+            time.sleep(delay)
+            attempt += 1
+
+    def _get_json(self, url, params, timeout, conditional=False):
+        """
+        GET and decode a JSON response. With conditional=True the ETag or
+        Last-Modified of the previous response is sent back, and a 304 reuses
+        the body decoded last time instead of downloading it again.
+        """
+        if not conditional:
+            r = self._request("GET", url, params=params, timeout=timeout)
+            r.raise_for_status()
+            return _json(r)
+
+        cache_key = (url, tuple(sorted((params or {}).items())))
+        cached = self._validators.get(cache_key)
+        headers = {}
+        if cached is not None:
+            etag, last_modified, _ = cached
+            if etag:
+                headers["If-None-Match"] = etag
+            elif last_modified:
+                headers["If-Modified-Since"] = last_modified
+        r = self._request("GET", url, params=params, headers=headers, timeout=timeout)
+        if r.status_code == 304 and cached is not None:
+            return cached[2]
+        r.raise_for_status()
+        data = _json(r)
+        etag = r.headers.get("ETag")
+        last_modified = r.headers.get("Last-Modified")
+        if etag or last_modified:
+            self._validators[cache_key] = (etag, last_modified, data)
+        return data
+
+    def _paginate(self, url, params, items_key, max_results=50, timeout=30, conditional=False,
+                  step_by_items=False):
+        """
+        Yield every item of a startAt/maxResults paginated endpoint, page by page.
+
+        The first page tells us the total, after which the remaining pages are
+        requested concurrently and yielded in offset order as they arrive.
+        Endpoints that don't report a total (e.g. board sprints) are walked
+        serially until isLast. Offsets advance by the page size, as Jira
+        documents; step_by_items=True advances by the number of items each page
+        actually returned instead and tops up short pages, for endpoints (issue
+        comments) that trim pages without skipping the trimmed items.
+        """
+        def fetch(start_at, page_size):
+            return self._get_json(url, dict(params, startAt=start_at, maxResults=page_size), timeout, conditional)
+
+        data = fetch(0, max_results)
+        first = data.get(items_key, [])
+        yield from first
+        total = data.get("total")
+
+        if total is None:
+            start_at = 0
+            # A page trimmed to nothing may still not be the last one unless offsets follow the items
+            while not data.get("isLast", True) and (first or not step_by_items):
+                start_at += len(first) if step_by_items else (data.get("maxResults") or max_results)
+                data = fetch(start_at, max_results)
+                first = data.get(items_key, [])
+                yield from first
+            return
+
+        if step_by_items:
+            # Size the remaining requests by what the server really hands out per page
+            page_size = len(first)
+        else:
+            # The server may cap maxResults below what we asked for
+            page_size = data.get("maxResults") or max_results
+        if not page_size or page_size >= total:
+            return
+        offsets = range(page_size, total, page_size)
+
+        def fetch_span(start_at):
+            if not step_by_items:
+                return fetch(start_at, page_size).get(items_key, [])
+            # A page that comes back short is topped up serially so no item is skipped
+            end = min(start_at + page_size, total)
+            items = []
+            while start_at < end:
+                got = fetch(start_at, end - start_at).get(items_key, [])
+                if not got:
+                    break
+                items.extend(got)
+                start_at += len(got)
+            return items
+
+        with ThreadPoolExecutor(max_workers=min(PAGE_WORKERS, len(offsets))) as executor:
+            futures = [executor.submit(fetch_span, off) for off in offsets]
+            try:
+                for fut in futures:
+                    yield from fut.result()
+            finally:
+                # Caller stopped early: don't fetch pages nobody will read
+                for fut in futures:
+                    fut.cancel()
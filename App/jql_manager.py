@@ -5,7 +5,32 @@ Handles saving, loading, and managing JQL queries.
 
 import json
 import os
-from typing import List, Dict, Optional
+from typing import Callable, List, Dict, Optional
+
+try:
+    import orjson
+except ImportError:  # optional speedup; fall back to the stdlib json module
+    orjson = None
+
+class Query:
+    """A saved JQL query. Slotted so large query lists don't carry a dict per entry."""
+    
+    __slots__ = ('name', 'jql', 'description')
+    
+    def __init__(self, name: str, jql: str, description: str = ""):
+        self.name = name
+        self.jql = jql
+        self.description = description
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, str]) -> 'Query':
+        return cls(data['name'], data['jql'], data.get('description') or "")
+    
+    def to_dict(self) -> Dict[str, str]:
+        return {'name': self.name, 'jql': self.jql, 'description': self.description}
+    
+    def __repr__(self):
+        return f"Query(name={self.name!r}, jql={self.jql!r}, description={self.description!r})"
 
 class JQLManager:
     """Manager for saving and loading JQL queries"""
@@ -24,35 +49,100 @@ class JQLManager:
         
         self.config_file = config_file
         self.queries = []
+        self._by_name = {}  # name -> Query (the same objects as in self.queries)
+        self._mtime = None  # mtime_ns of the file self.queries was last synced with
+        self._observers = []  # callbacks run whenever the query list changes
         self.load_queries()
     
-    def load_queries(self) -> List[Dict[str, str]]:
+    def load_queries(self) -> List[Query]:
         """Load queries from the config file
         
         Returns:
-            List of query dictionaries with 'name', 'jql', and optional 'description'
+            List of Query objects
         """
-        if os.path.exists(self.config_file):
-            try:
+        try:
+            mtime = os.stat(self.config_file).st_mtime_ns
+        except OSError:
+            had_queries = bool(self.queries)
+            self.queries = []
+            self._by_name = {}
+            self._mtime = None
+            if had_queries:
+                self._notify()
+            return self.queries
+        
+        # Nothing changed on disk since the last load/save
+        if mtime == self._mtime:
+            return self.queries
+        
+        try:
+            if orjson is not None:
+                with open(self.config_file, 'rb') as f:
+                    data = orjson.loads(f.read())
+            else:
                 with open(self.config_file, 'r', encoding='utf-8') as f:
-                    self.queries = json.load(f)
-                return self.queries
-            except Exception as e:
-                print(f"Error loading JQL queries: {e}")
-                self.queries = []
-        else:
+                    data = json.load(f)
+            self.queries = [Query.from_dict(d) for d in data]
+            self._mtime = mtime
+        except Exception as e:
+            print(f"Error loading JQL queries: {e}")
             self.queries = []
+            self._mtime = None
+        self._reindex()
+        self._notify()
         return self.queries
     
+    def add_observer(self, callback: Callable[[], None]):
+        """Call callback() after every change to the saved queries
+        
+        Args:
+            callback: Function taking no arguments
+        """
+        if callback not in self._observers:
+            self._observers.append(callback)
+    
+    def remove_observer(self, callback: Callable[[], None]):
+        """Stop notifying a callback registered with add_observer"""
+        if callback in self._observers:
+            self._observers.remove(callback)
+    
+    def _notify(self):
+        for callback in list(self._observers):
+            callback()
+    
+    def _commit(self) -> bool:
+        # Observers hear about the change even if writing the file failed,
+        # since the in-memory list has changed either way
+        saved = self.save_queries()
+        self._notify()
+        return saved
+    
+    def _reindex(self):
+        self._by_name = {}
+        for q in self.queries:
+            # First entry wins, as with the old linear scans
+            self._by_name.setdefault(q.name, q)
+    
     def save_queries(self) -> bool:
         """Save queries to the config file
         
+        The file is written to a temporary sibling and swapped in with
+        os.replace, so a crash mid-write never leaves a truncated file.
+        
         Returns:
             True if successful, False otherwise
         """
+        tmp_file = self.config_file + ".tmp"
+        data = [q.to_dict() for q in self.queries]
         try:
-            with open(self.config_file, 'w', encoding='utf-8') as f:
-                json.dump(self.queries, f, indent=2, ensure_ascii=False)
+            if orjson is not None:
+                with open(tmp_file, 'wb') as f:
+                    f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+            else:
+                with open(tmp_file, 'w', encoding='utf-8') as f:
+                    json.dump(data, f, indent=2, ensure_ascii=False)
+            os.replace(tmp_file, self.config_file)
+            self._mtime = os.stat(self.config_file).st_mtime_ns
             return True
         except Exception as e:
             print(f"Error saving JQL queries: {e}")
@@ -70,16 +160,13 @@ class JQLManager:
             True if successful, False if name already exists
         """
         # Check if name already exists
-        if any(q['name'] == name for q in self.queries):
+        if name in self._by_name:
             return False
         
-        query = {
-            'name': name,
-            'jql': jql,
-            'description': description
-        }
+        query = Query(name, jql, description)
         self.queries.append(query)
-        return self.save_queries()
+        self._by_name[name] = query
+        return self._commit()
     
     def update_query(self, name: str, jql: str, description: str = "") -> bool:
         """Update an existing query
@@ -92,12 +179,12 @@ class JQLManager:
         Returns:
             True if successful, False if query not found
         """
-        for query in self.queries:
-            if query['name'] == name:
-                query['jql'] = jql
-                query['description'] = description
-                return self.save_queries()
-        return False
+        query = self._by_name.get(name)
+        if query is None:
+            return False
+        query.jql = jql
+        query.description = description
+        return self._commit()
     
     def delete_query(self, name: str) -> bool:
         """Delete a query by name
@@ -108,32 +195,27 @@ class JQLManager:
         Returns:
             True if successful, False if query not found
         """
-        original_length = len(self.queries)
-        self.queries = [q for q in self.queries if q['name'] != name]
-        
-        if len(self.queries) < original_length:
-            return self.save_queries()
-        return False
+        if self._by_name.pop(name, None) is None:
+            return False
+        self.queries = [q for q in self.queries if q.name != name]
+        return self._commit()
     
-    def get_query(self, name: str) -> Optional[Dict[str, str]]:
+    def get_query(self, name: str) -> Optional[Query]:
         """Get a query by name
         
         Args:
             name: Name of the query
             
         Returns:
-            Query dictionary or None if not found
+            Query or None if not found
         """
-        for query in self.queries:
-            if query['name'] == name:
-                return query
-        return None
+        return self._by_name.get(name)
     
-    def get_all_queries(self) -> List[Dict[str, str]]:
+    def get_all_queries(self) -> List[Query]:
         """Get all saved queries
         
         Returns:
-            List of all query dictionaries
+            List of all queries
         """
         return self.queries.copy()
     
@@ -143,4 +225,19 @@ class JQLManager:
         Returns:
             List of query names
         """
-        return [q['name'] for q in self.queries]
+        return list(self._by_name)
+
+_shared_manager = None
+
+def get_shared_manager() -> JQLManager:
+    """Return the process-wide JQLManager for the default queries file
+    
+    Tabs share one manager, so a query saved in one tab reaches the others'
+    observers. Each call re-checks the file (a stat when it is unchanged).
+    """
+    global _shared_manager
+    if _shared_manager is None:
+        _shared_manager = JQLManager()
+    else:
+        _shared_manager.load_queries()
+    return _shared_manager
@@ -5,7 +5,7 @@ A reusable widget that provides both dropdown selection of saved queries and man
 
 import tkinter as tk
 from tkinter import ttk, messagebox, simpledialog
-from jql_manager import JQLManager
+from jql_manager import JQLManager, get_shared_manager
 
 class JQLSelectorWidget(ttk.Frame):
     """Widget that allows users to select from saved JQL queries or enter custom ones"""
@@ -15,17 +15,21 @@ class JQLSelectorWidget(ttk.Frame):
         
         Args:
             master: Parent widget
-            jql_manager: JQLManager instance (creates new one if None)
+            jql_manager: JQLManager instance (the shared one if None)
             default_value: Default JQL text to display
             **kwargs: Additional arguments for ttk.Frame
         """
         super().__init__(master, **kwargs)
         
-        self.jql_manager = jql_manager or JQLManager()
+        self.jql_manager = jql_manager or get_shared_manager()
         self.jql_var = tk.StringVar(value=default_value)
         
         self._build_ui()
         self._refresh_saved_queries()
+        
+        # Refresh only when the manager reports a change, instead of after every action
+        self.jql_manager.add_observer(self._refresh_saved_queries)
+        self.bind("<Destroy>", self._on_destroy, add="+")
     
     def _build_ui(self):
         """Build the widget UI"""
@@ -44,7 +48,9 @@ class JQLSelectorWidget(ttk.Frame):
         ttk.Button(top_row, text="🗑️ Delete", 
                   command=self._delete_selected_query).pack(side="left", padx=(0, 5))
         ttk.Button(top_row, text="✏️ Rename", 
-                  command=self._rename_selected_query).pack(side="left")
+                  command=self._rename_selected_query).pack(side="left", padx=(0, 5))
+        ttk.Button(top_row, text="🔄 Reload", 
+                  command=self._reload_saved_queries).pack(side="left")
         
         # Bottom row: JQL text entry
         bottom_row = ttk.Frame(self)
@@ -55,9 +61,16 @@ class JQLSelectorWidget(ttk.Frame):
         jql_entry = ttk.Entry(bottom_row, textvariable=self.jql_var, width=80)
         jql_entry.pack(side="left", fill="x", expand=True)
     
+    def _reload_saved_queries(self):
+        """Re-read saved queries from disk (e.g. after saving one in another tab)"""
+        self.jql_manager.load_queries()  # notifies observers if anything changed
+    
+    def _on_destroy(self, event=None):
+        if event is None or event.widget is self:
+            self.jql_manager.remove_observer(self._refresh_saved_queries)
+    
     def _refresh_saved_queries(self):
-        """Refresh the dropdown list of saved queries"""
-        self.jql_manager.load_queries()
+        """Refresh the dropdown list from the manager's in-memory queries"""
         query_names = self.jql_manager.get_query_names()
         
         if query_names:
@@ -75,12 +88,12 @@ class JQLSelectorWidget(ttk.Frame):
         
         query = self.jql_manager.get_query(selected_name)
         if query:
-            self.jql_var.set(query['jql'])
+            self.jql_var.set(query.jql)
             
             # Show description if available
-            if query.get('description'):
+            if query.description:
                 messagebox.showinfo("Query Description", 
-                                   f"Query: {selected_name}\n\n{query['description']}")
+                                   f"Query: {selected_name}\n\n{query.description}")
     
     def _save_current_query(self):
         """Save the current JQL query"""
@@ -105,12 +118,11 @@ class JQLSelectorWidget(ttk.Frame):
             # Ask for description
             description = simpledialog.askstring("Query Description (Optional)", 
                                                  "Enter a description for this query:",
-                                                 initialvalue=self.jql_manager.get_query(name).get('description', ''))
+                                                 initialvalue=self.jql_manager.get_query(name).description)
             description = description or ""
             
             if self.jql_manager.update_query(name, current_jql, description):
                 messagebox.showinfo("Success", f"Query '{name}' updated successfully")
-                self._refresh_saved_queries()
             else:
                 messagebox.showerror("Error", "Failed to update query")
         else:
@@ -121,7 +133,6 @@ class JQLSelectorWidget(ttk.Frame):
             
             if self.jql_manager.add_query(name, current_jql, description):
                 messagebox.showinfo("Success", f"Query '{name}' saved successfully")
-                self._refresh_saved_queries()
             else:
                 messagebox.showerror("Error", "Failed to save query")
     
@@ -136,10 +147,9 @@ class JQLSelectorWidget(ttk.Frame):
                               f"Are you sure you want to delete the query '{selected_name}'?"):
             if self.jql_manager.delete_query(selected_name):
                 messagebox.showinfo("Success", f"Query '{selected_name}' deleted")
-                self._refresh_saved_queries()
                 # Clear the entry if it was showing the deleted query
                 query = self.jql_manager.get_query(selected_name)
-                if query and self.jql_var.get() == query['jql']:
+                if query and self.jql_var.get() == query.jql:
                     self.jql_var.set("")
             else:
                 messagebox.showerror("Error", "Failed to delete query")
@@ -171,12 +181,11 @@ class JQLSelectorWidget(ttk.Frame):
         
         # Delete old and add with new name
         if self.jql_manager.delete_query(selected_name):
-            if self.jql_manager.add_query(new_name, query['jql'], query.get('description', '')):
+            if self.jql_manager.add_query(new_name, query.jql, query.description):
                 messagebox.showinfo("Success", f"Query renamed to '{new_name}'")
-                self._refresh_saved_queries()
             else:
                 # Restore old query if add failed
-                self.jql_manager.add_query(selected_name, query['jql'], query.get('description', ''))
+                self.jql_manager.add_query(selected_name, query.jql, query.description)
                 messagebox.showerror("Error", "Failed to rename query")
         else:
             messagebox.showerror("Error", "Failed to rename query")
@@ -1,53 +1,157 @@
+from __future__ import annotations
+
 import os
 import json
+from bisect import bisect_left
 import threading
-from datetime import datetime, timedelta
-from dateutil import parser as dtparser, tz
-import pytz
+from concurrent.futures import Future
+from copy import deepcopy
+from datetime import date, datetime, time, timedelta
+from functools import lru_cache
+from importlib import import_module
+from itertools import islice
+from queue import Empty, SimpleQueue
+from typing import TYPE_CHECKING
+try:
+    import orjson
+except ImportError:  # optional speedup; fall back to the stdlib json module
+    orjson = None
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
 import re
 
-from jira_client import JiraClient
-from export_csv import export_csv
-from export_json import export_json, export_markdown
-from sprint_analysis import analyze_sprint_patterns, analyze_sprint_patterns_by_sprint
-from timeline_report_ui import TimelineReportTab
+# jira_client (the requests/httpx stack) and the export/report modules are
+# imported where they are first used, so the window paints without them;
+# MainWindow preloads them in the background once it is up
 from jql_selector_widget import JQLSelectorWidget
-from jql_manager import JQLManager
+from jql_manager import get_shared_manager
+from progress_throttle import throttled_progress
+
+if TYPE_CHECKING:
+    from jira_client import JiraClient
+
+_DEFERRED_MODULES = ("jira_client", "export_csv", "export_json", "sprint_analysis", "timeline_report_ui")
+
+def _preload_deferred_modules():
+    """Import the deferred modules off the UI thread so the first login doesn't wait on them"""
+    for name in _DEFERRED_MODULES:
+        import_module(name)
 
 APP_DIR = os.path.join(os.path.expanduser("~"), ".jira_metrics")
 CREDS_PATH = os.path.join(APP_DIR, "credentials.json")
 CONFIG_DIR = os.path.join(APP_DIR, "configs")
 CONNECTIONS_PATH = os.path.join(APP_DIR, "connections.json")
+# last_used bumps are appended here and folded into connections.json on the next full save
+CONNECTION_EVENTS_PATH = os.path.join(APP_DIR, "connection_events.jsonl")
+CONNECTION_EVENTS_COMPACT_BYTES = 64 * 1024
+
+CSV_WRITE_BUFFER = 1 << 20  # bytes of file buffering for CSV exports
+CSV_WRITE_BATCH = 512  # rows handed to writerows at a time
+LOG_FLUSH_MS = 100  # how often queued log lines are written to the console
+LOG_TO_STDOUT = bool(os.environ.get("JIRA_METRICS_LOG_STDOUT"))  # also echo log lines to stdout
+UI_WORKERS = 4  # background jobs (login, searches, exports) running at once
 
 def ensure_app_dirs():
     os.makedirs(APP_DIR, exist_ok=True)
     os.makedirs(CONFIG_DIR, exist_ok=True)
 
+def _read_json(path):
+    if orjson is not None:
+        with open(path, "rb") as f:
+            return orjson.loads(f.read())
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+# path -> (st_mtime_ns, st_size, parsed JSON); callers get deep copies since
+# several of them edit what they load before saving it back
+_JSON_CACHE = {}
+
+def _read_json_cached(path):
+    st = os.stat(path)
+    hit = _JSON_CACHE.get(path)
+    if hit is None or hit[0] != st.st_mtime_ns or hit[1] != st.st_size:
+        hit = _JSON_CACHE[path] = (st.st_mtime_ns, st.st_size, _read_json(path))
+    return deepcopy(hit[2])
+
+def _atomic_write(path, data):
+    """Write bytes to a temporary sibling and swap it in, so a crash mid-write
+    never leaves a truncated file behind"""
+    tmp = path + ".tmp"
+    with open(tmp, "wb") as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+
+def _write_json(path, obj, indent=True):
+    _JSON_CACHE.pop(path, None)
+    if orjson is not None:
+        data = orjson.dumps(obj, option=(orjson.OPT_INDENT_2 if indent else 0) | orjson.OPT_NON_STR_KEYS)
+    else:
+        data = json.dumps(obj, indent=2 if indent else None).encode("utf-8")
+    _atomic_write(path, data)
+
 def load_credentials():
     """Load the last used credentials (for backward compatibility)"""
     if os.path.exists(CREDS_PATH):
-        with open(CREDS_PATH, "r", encoding="utf-8") as f:
-            return json.load(f)
+        return _read_json_cached(CREDS_PATH)
     return None
 
 def save_credentials(base_url, email, api_token):
     """Save credentials as the default (for backward compatibility)"""
     ensure_app_dirs()
-    with open(CREDS_PATH, "w", encoding="utf-8") as f:
-        json.dump({"base_url": base_url, "email": email, "api_token": api_token}, f)
+    _write_json(CREDS_PATH, {"base_url": base_url, "email": email, "api_token": api_token}, indent=False)
 
 def load_saved_connections():
     """Load all saved connections"""
     if os.path.exists(CONNECTIONS_PATH):
         try:
-            with open(CONNECTIONS_PATH, "r", encoding="utf-8") as f:
-                return json.load(f)
+            connections = _read_json_cached(CONNECTIONS_PATH)
         except Exception:
             return {}
+        _apply_connection_events(connections)
+        return connections
     return {}
 
+def _apply_connection_events(connections):
+    """Overlay the last_used times journaled by touch_connection"""
+    try:
+        with open(CONNECTION_EVENTS_PATH, "rb") as f:
+            lines = f.read().splitlines()
+    except OSError:
+        return
+    loads = orjson.loads if orjson is not None else json.loads
+    for line in lines:
+        try:
+            event = loads(line)
+        except ValueError:
+            continue  # a torn last line from an interrupted append
+        if not isinstance(event, dict):
+            continue
+        conn = connections.get(event.get("n"))
+        if conn is not None:
+            conn["last_used"] = event.get("t")
+
+def _save_connections(connections):
+    """Rewrite connections.json; connections must come from load_saved_connections,
+    so the journaled last_used times are already in it and the journal can go"""
+    _write_json(CONNECTIONS_PATH, connections)
+    try:
+        os.remove(CONNECTION_EVENTS_PATH)
+    except FileNotFoundError:
+        pass
+
+def touch_connection(name):
+    """Record that a saved connection was just used, without rewriting connections.json"""
+    ensure_app_dirs()
+    event = {"n": name, "t": datetime.now().isoformat()}
+    line = orjson.dumps(event) if orjson is not None else json.dumps(event).encode("utf-8")
+    with open(CONNECTION_EVENTS_PATH, "ab") as f:
+        f.write(line + b"\n")
+        size = f.tell()
+    if size > CONNECTION_EVENTS_COMPACT_BYTES:
+        _save_connections(load_saved_connections())
+
 def save_connection(base_url, email, api_token, name=None):
     """Save a connection with a friendly name"""
     ensure_app_dirs()
@@ -71,65 +175,202 @@ def save_connection(base_url, email, api_token, name=None):
         "last_used": datetime.now().isoformat()
     }
     
-    with open(CONNECTIONS_PATH, "w", encoding="utf-8") as f:
-        json.dump(connections, f, indent=2)
+    _save_connections(connections)
     
     return name
 
+# Config names keyed by the directory's mtime; save_config drops it outright
+# because coarse filesystem timestamps can miss a file added in the same tick
+_CONFIGS_CACHE = {"mtime": None, "value": None}
+
 def list_configs():
     ensure_app_dirs()
-    names = []
-    for fn in os.listdir(CONFIG_DIR):
-        if fn.endswith(".json"):
-            names.append(fn[:-5])
-    return sorted(names)
+    mtime = os.stat(CONFIG_DIR).st_mtime_ns
+    if _CONFIGS_CACHE["value"] is None or _CONFIGS_CACHE["mtime"] != mtime:
+        # DirEntry.is_file() reuses the type from the directory listing, so
+        # skipping stray folders costs no extra stat
+        with os.scandir(CONFIG_DIR) as it:
+            names = sorted(e.name[:-5] for e in it if e.name.endswith(".json") and e.is_file())
+        _CONFIGS_CACHE["mtime"] = mtime
+        _CONFIGS_CACHE["value"] = names
+    return list(_CONFIGS_CACHE["value"])
 
 def load_config(name):
     path = os.path.join(CONFIG_DIR, f"{name}.json")
-    with open(path, "r", encoding="utf-8") as f:
-        return json.load(f)
+    return _read_json_cached(path)
 
 def save_config(cfg):
     ensure_app_dirs()
     name = cfg.get("name", "config")
     path = os.path.join(CONFIG_DIR, f"{name}.json")
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(cfg, f, indent=2)
+    _write_json(path, cfg)
+    _CONFIGS_CACHE["value"] = None
 
+@lru_cache(maxsize=64)
 def parse_time_hhmm(s):
-    return datetime.strptime(s, "%H:%M").time()
+    hh, sep, mm = s.partition(":")
+    if not (sep and s.isascii() and 1 <= len(hh) <= 2 and 1 <= len(mm) <= 2 and hh.isdigit() and mm.isdigit()):
+        raise ValueError(f"time data {s!r} does not match format '%H:%M'")
+    return time(int(hh), int(mm))
+
+@lru_cache(maxsize=1)
+def _timezone_names():
+    """Sorted zone names for the business-hours combobox, built on first use"""
+    import pytz
+    return tuple(sorted(pytz.all_timezones))
+
+@lru_cache(maxsize=64)
+def _get_tz(tzname):
+    import pytz  # deferred until business hours are first used
+    return pytz.timezone(tzname)
+
+@lru_cache(maxsize=64)
+def _dst_dates(tzname):
+    """Local dates on which tzname changes its UTC offset (empty for fixed-offset zones)"""
+    import pytz
+    tzinfo = _get_tz(tzname)
+    dates = set()
+    for t in getattr(tzinfo, "_utc_transition_times", ()):
+        try:
+            utc_t = pytz.utc.localize(t)
+            dates.add((utc_t - timedelta(seconds=1)).astimezone(tzinfo).date())
+            dates.add(utc_t.astimezone(tzinfo).date())
+        except (OverflowError, ValueError):
+            pass  # the datetime.min sentinel pytz puts first
+    return frozenset(dates)
+
+def _business_hours_context(bh):
+    """Resolve a business-hours config into what the overlap math needs"""
+    return _resolve_business_hours(
+        bh.get("timezone", "UTC"),
+        bh.get("start", "09:00"),
+        bh.get("end", "17:00"),
+        bool(bh.get("exclude_weekends", True)),
+        tuple(bh.get("holidays", ())),
+    )
+
+def _parse_ymd(s):
+    parts = s.split("-")
+    if len(parts) == 3 and s.isascii():
+        y, m, d = parts
+        if len(y) == 4 and 1 <= len(m) <= 2 and 1 <= len(d) <= 2 and y.isdigit() and m.isdigit() and d.isdigit():
+            return date(int(y), int(m), int(d))
+    # Odd spellings strptime still accepts (e.g. a space-padded day)
+    return datetime.strptime(s, "%Y-%m-%d").date()
+
+@lru_cache(maxsize=32)
+def _parsed_holidays(holidays):
+    parsed = set()
+    for h in holidays:
+        try:
+            parsed.add(_parse_ymd(h))
+        except Exception:
+            pass
+    return frozenset(parsed)
+
+@lru_cache(maxsize=32)
+def _resolve_business_hours(tzname, start, end, exclude_weekends, holidays):
+    # Cached per config, so an export parses it once rather than per segment.
+    # The returned dict is shared; callers must treat it as read-only.
+    start_time = parse_time_hhmm(start)
+    end_time = parse_time_hhmm(end)
+    holiday_dates = _parsed_holidays(holidays)
+    full_day_hours = max(0.0, (
+        (end_time.hour * 60 + end_time.minute) - (start_time.hour * 60 + start_time.minute)
+    ) / 60.0)
+    return {
+        "tzinfo": _get_tz(tzname),
+        "start_time": start_time,
+        "end_time": end_time,
+        "exclude_weekends": exclude_weekends,
+        "holidays": holiday_dates,
+        "holiday_ordinals": tuple(sorted(d.toordinal() for d in holiday_dates)),
+        "full_day_hours": full_day_hours,
+        "dst_ordinals": tuple(sorted(d.toordinal() for d in _dst_dates(tzname))),
+    }
 
-def business_hours_overlap(start_dt, end_dt, bh):
-    import pytz as _pytz
-    tzname = bh.get("timezone", "UTC")
-    tzinfo = _pytz.timezone(tzname)
+# _WEEKDAYS_IN_RUN[wd][n]: Monday-Friday dates among n consecutive days starting on weekday wd
+_WEEKDAYS_IN_RUN = tuple(
+    tuple(sum(1 for i in range(n) if (wd + i) % 7 < 5) for n in range(7))
+    for wd in range(7)
+)
+
+def _weekdays_between(first_ord, stop_ord):
+    """Number of Monday-Friday dates with ordinals in [first_ord, stop_ord)"""
+    n = stop_ord - first_ord
+    if n <= 0:
+        return 0
+    weeks, rem = divmod(n, 7)
+    # date.fromordinal(1) is a Monday
+    return weeks * 5 + _WEEKDAYS_IN_RUN[(first_ord - 1) % 7][rem]
+
+def _overlap_hours(start_dt, end_dt, ctx):
+    tzinfo = ctx["tzinfo"]
     start_dt = start_dt.astimezone(tzinfo)
     end_dt = end_dt.astimezone(tzinfo)
     if end_dt <= start_dt:
         return 0.0
-    start_time = parse_time_hhmm(bh.get("start", "09:00"))
-    end_time = parse_time_hhmm(bh.get("end", "17:00"))
-    exclude_weekends = bh.get("exclude_weekends", True)
-    holidays = set()
-    for h in bh.get("holidays", []):
-        try:
-            holidays.add(datetime.strptime(h, "%Y-%m-%d").date())
-        except Exception:
-            pass
+    start_time = ctx["start_time"]
+    end_time = ctx["end_time"]
+    exclude_weekends = ctx["exclude_weekends"]
+    holidays = ctx["holidays"]
+
+    def day_hours(day):
+        day_start = tzinfo.localize(datetime.combine(day, start_time))
+        day_end = tzinfo.localize(datetime.combine(day, end_time))
+        seg_start = max(start_dt, day_start)
+        seg_end = min(end_dt, day_end)
+        if seg_end > seg_start:
+            return (seg_end - seg_start).total_seconds() / 3600.0
+        return 0.0
 
-    total = 0.0
-    cur = start_dt.date()
-    while cur <= end_dt.date():
-        if not (exclude_weekends and cur.weekday() >= 5) and cur not in holidays:
-            day_start = tzinfo.localize(datetime.combine(cur, start_time))
-            day_end = tzinfo.localize(datetime.combine(cur, end_time))
-            seg_start = max(start_dt, day_start)
-            seg_end = min(end_dt, day_end)
-            if seg_end > seg_start:
-                total += (seg_end - seg_start).total_seconds() / 3600.0
-        cur += timedelta(days=1)
+    def is_business_day(day):
+        return not (exclude_weekends and day.weekday() >= 5) and day not in holidays
+
+    first_day = start_dt.date()
+    last_day = end_dt.date()
+    total = day_hours(first_day) if is_business_day(first_day) else 0.0
+    if last_day == first_day:
+        return total
+    if is_business_day(last_day):
+        total += day_hours(last_day)
+
+    # Days strictly between the first and last lie wholly inside the interval,
+    # so each contributes the same wall-clock window: count them arithmetically
+    # and only localize the days with a DST change to get their real length
+    lo = first_day.toordinal() + 1
+    hi = last_day.toordinal()
+    if hi <= lo:
+        return total
+    business_days = _weekdays_between(lo, hi) if exclude_weekends else hi - lo
+    hol = ctx["holiday_ordinals"]
+    for o in hol[bisect_left(hol, lo):bisect_left(hol, hi)]:
+        if not exclude_weekends or (o - 1) % 7 < 5:
+            business_days -= 1
+    total += business_days * ctx["full_day_hours"]
+    dst = ctx["dst_ordinals"]
+    for o in dst[bisect_left(dst, lo):bisect_left(dst, hi)]:
+        day = date.fromordinal(o)
+        if is_business_day(day):
+            total += day_hours(day) - ctx["full_day_hours"]
     return total
 
+def business_hours_overlap(start_dt, end_dt, bh):
+    return _overlap_hours(start_dt, end_dt, _business_hours_context(bh))
+
+def business_hours_overlap_batch(intervals, bh):
+    """Business hours for each (start_dt, end_dt) in intervals, resolving bh only once"""
+    ctx = _business_hours_context(bh)
+    return [_overlap_hours(s, e, ctx) for s, e in intervals]
+
+def _throttled_progress(widget, stage_var, pb):
+    """Throttled progress_cb that shows the stage in stage_var and done/total on pb"""
+    def apply(stage, done, total):
+        stage_var.set(stage)
+        pb.configure(maximum=total if total else 1, value=min(done, total) if total else done)
+
+    return throttled_progress(widget, apply)
+
 class LogConsole(tk.Text):
     def __init__(self, master, **kwargs):
         super().__init__(master, **kwargs)
@@ -150,11 +391,28 @@ class LogConsole(tk.Text):
         self.tag_config("info", foreground="#333333")   # Dark gray for info
         self.tag_config("success", foreground="#107c10") # Green for success
     
+        # Messages arrive from worker threads, sometimes in bursts; they are queued
+        # here and flushed on the Tk thread with one insert per tick
+        self._pending = SimpleQueue()
+        self.after(LOG_FLUSH_MS, self._flush)
+
     def write(self, msg, level="info"):
-        self.configure(state="normal")
-        self.insert("end", msg + "\n", level)
-        self.see("end")
-        self.configure(state="disabled")
+        self._pending.put((msg, level))
+
+    def _flush(self):
+        chunks = []
+        while True:
+            try:
+                msg, level = self._pending.get_nowait()
+            except Empty:
+                break
+            chunks += (msg + "\n", level)
+        if chunks:
+            self.configure(state="normal")
+            self.insert("end", *chunks)
+            self.see("end")
+            self.configure(state="disabled")
+        self.after(LOG_FLUSH_MS, self._flush)
 
 class LoginWindow(tk.Toplevel):
     def __init__(self, master, on_success, log_fn, switching_instance=False):
@@ -277,6 +535,7 @@ class LoginWindow(tk.Toplevel):
             messagebox.showerror("Error", "Selected connection not found.")
             return
             
+        from jira_client import JiraClient
         client = JiraClient(conn["base_url"], conn["email"], conn["api_token"], log_fn=self.log)
         self.log(f"Testing saved connection '{selected}'...")
         
@@ -287,21 +546,20 @@ class LoginWindow(tk.Toplevel):
             if ok:
                 self.log(f"Login success with saved connection '{selected}'.", "success")
                 # Update last used time
-                conn["last_used"] = datetime.now().isoformat()
-                with open(CONNECTIONS_PATH, "w", encoding="utf-8") as f:
-                    json.dump(saved_connections, f, indent=2)
+                touch_connection(selected)
                 self.on_success(client)
                 self.destroy()
             else:
                 messagebox.showerror("Login Failed", f"Saved connection '{selected}' is invalid.")
                 
-        threading.Thread(target=lambda: self._run_worker(test_connection, on_done), daemon=True).start()
+        self._root().submit(self._run_worker, test_connection, on_done)
 
     def use_saved(self):
         creds = load_credentials()
         if not creds:
             messagebox.showerror("Error", "No saved credentials found.")
             return
+        from jira_client import JiraClient
         client = JiraClient(creds["base_url"], creds["email"], creds["api_token"], log_fn=self.log)
         self.log("Testing saved credentials...")
         if client.test_connection():
@@ -318,6 +576,7 @@ class LoginWindow(tk.Toplevel):
         if not base_url or not email or not token:
             messagebox.showerror("Error", "Please enter URL, Email, and API Token.")
             return
+        from jira_client import JiraClient
         client = JiraClient(base_url, email, token, log_fn=self.log)
         self.log("Testing credentials...")
         self.btn_login.configure(state="disabled")
@@ -339,7 +598,7 @@ class LoginWindow(tk.Toplevel):
                 self.destroy()
             else:
                 messagebox.showerror("Connection Failed", "Invalid credentials or URL.")
-        threading.Thread(target=lambda: self._run_worker(worker, on_done), daemon=True).start()
+        self._root().submit(self._run_worker, worker, on_done)
 
     def _run_worker(self, worker, on_done):
         try:
@@ -350,6 +609,80 @@ class LoginWindow(tk.Toplevel):
         finally:
             self.after(0, lambda: on_done(ok))
 
+# Field values come straight from Jira's JSON, so almost every value is one of a
+# handful of exact types; dispatch on type() and keep the isinstance chain for the rest
+def _preview_dict(v):
+    if "displayName" in v: return v["displayName"]
+    if "name" in v: return v["name"]
+    if "value" in v: return v["value"]
+    return "{...}"
+
+def _preview_list(v):
+    return f"[{len(v)} item(s)]"
+
+def _preview_scalar(v):
+    s = str(v)
+    return s if len(s) <= 200 else s[:197] + "..."
+
+def _preview_str(v):
+    return v if len(v) <= 200 else v[:197] + "..."
+
+def _preview_other(v):
+    if isinstance(v, dict):
+        return _preview_dict(v)
+    if isinstance(v, list):
+        return _preview_list(v)
+    if v is None:
+        return ""
+    return _preview_scalar(v)
+
+_PREVIEW_BY_TYPE = {
+    dict: _preview_dict,
+    list: _preview_list,
+    type(None): lambda v: "",
+    str: _preview_str,
+    int: _preview_scalar,
+    float: _preview_scalar,
+    bool: _preview_scalar,
+}
+
+def _cell_list(val):
+    items = []
+    for x in val:
+        if isinstance(x, dict):
+            items.append(x.get("displayName") or x.get("name") or x.get("value") or x.get("key") or str(x))
+        else:
+            items.append(str(x))
+    return ", ".join(items)
+
+def _cell_dict(val):
+    if "displayName" in val: return val["displayName"]
+    if "name" in val: return val["name"]
+    if "value" in val: return val["value"]
+    if "key" in val: return val["key"]
+    return json.dumps(val, ensure_ascii=False)
+
+def _cell_other(val):
+    if isinstance(val, list):
+        return _cell_list(val)
+    if isinstance(val, dict):
+        return _cell_dict(val)
+    return "" if val is None else str(val)
+
+_CELL_BY_TYPE = {
+    list: _cell_list,
+    dict: _cell_dict,
+    type(None): lambda val: "",
+    str: str,
+    int: str,
+    float: str,
+    bool: str,
+}
+
+# "Other Metrics" toggles in display order, with their checkbox labels
+_METRIC_LABELS = {k: k.replace("_", " ").title()
+                  for k in ("comment_count", "comment_length", "commenter_count", "time_in_status")}
+
 class ConfigTab(ttk.Frame):
     def __init__(self, master, jira_client: JiraClient, log_fn, field_id_to_name, field_name_to_id):
         super().__init__(master)
@@ -362,12 +695,7 @@ class ConfigTab(ttk.Frame):
         self.selected_field_ids = set()
 
         self.transition_rules = []
-        self.metrics_flags = {
-            "comment_count": tk.BooleanVar(value=True),
-            "comment_length": tk.BooleanVar(value=True),
-            "commenter_count": tk.BooleanVar(value=True),
-            "time_in_status": tk.BooleanVar(value=True),
-        }
+        self.metrics_flags = {k: tk.BooleanVar(value=True) for k in _METRIC_LABELS}
 
         self._build_ui()
 
@@ -451,7 +779,7 @@ class ConfigTab(ttk.Frame):
         toggles = ttk.LabelFrame(right, text="Other Metrics")
         toggles.grid(row=1, column=0, sticky="nsew")
         for i, (k, var) in enumerate(self.metrics_flags.items()):
-            ttk.Checkbutton(toggles, text=k.replace("_", " ").title(), variable=var).grid(row=i//2, column=i%2, sticky="w")
+            ttk.Checkbutton(toggles, text=_METRIC_LABELS[k], variable=var).grid(row=i//2, column=i%2, sticky="w")
 
         bh = ttk.LabelFrame(right, text="Business Hours")
         bh.grid(row=2, column=0, sticky="nsew", pady=(8,0))
@@ -465,7 +793,7 @@ class ConfigTab(ttk.Frame):
         ttk.Label(bh, text="End (HH:MM):").grid(row=0, column=2, sticky="w")
         ttk.Entry(bh, textvariable=self.bh_end, width=8).grid(row=0, column=3, sticky="w")
         ttk.Label(bh, text="Timezone:").grid(row=1, column=0, sticky="w")
-        tz_combo = ttk.Combobox(bh, textvariable=self.bh_tz, values=sorted(pytz.all_timezones), width=28)
+        tz_combo = ttk.Combobox(bh, textvariable=self.bh_tz, values=_timezone_names(), width=28)
         tz_combo.grid(row=1, column=1, columnspan=3, sticky="we")
         ttk.Checkbutton(bh, text="Exclude weekends", variable=self.bh_excl_wknd).grid(row=2, column=0, columnspan=2, sticky="w")
         ttk.Label(bh, text="Holidays (YYYY-MM-DD, comma separated):").grid(row=3, column=0, columnspan=4, sticky="w")
@@ -498,17 +826,7 @@ class ConfigTab(ttk.Frame):
         self.grid_rowconfigure(0, weight=1)
 
     def _preview_value(self, v):
-        if isinstance(v, dict):
-            if "displayName" in v: return v["displayName"]
-            if "name" in v: return v["name"]
-            if "value" in v: return v["value"]
-            return "{...}"
-        if isinstance(v, list):
-            return f"[{len(v)} item(s)]"
-        if v is None:
-            return ""
-        s = str(v)
-        return s if len(s) <= 200 else s[:197] + "..."
+        return _PREVIEW_BY_TYPE.get(type(v), _preview_other)(v)
 
     def _on_tree_click(self, event):
         region = self.fields_tree.identify("region", event.x, event.y)
@@ -535,19 +853,29 @@ class ConfigTab(ttk.Frame):
             return
         self.log(f"Loading issue {key} to fetch fields...")
         def worker():
-            return self.client.get_issue(key, expand_changelog=False)
-        def on_done(issue):
+            issue = self.client.get_issue(key, expand_changelog=False)
+            # Build the rows off the UI thread so on_done only touches the tree
             fields = issue.get("fields", {})
-            for item in self.fields_tree.get_children():
-                self.fields_tree.delete(item)
-            self.available_field_ids = list(fields.keys())
-            for fid in self.available_field_ids:
-                disp = self.field_id_to_name.get(fid, fid)
-                val = self._preview_value(fields.get(fid))
-                sel_mark = "✓" if fid in self.selected_field_ids else ""
-                self.fields_tree.insert("", "end", iid=fid, values=(sel_mark, disp, val))
+            name_of = self.field_id_to_name.get
+            preview = self._preview_value
+            return [(fid, name_of(fid, fid), preview(v)) for fid, v in fields.items()]
+        def on_done(rows):
+            tree = self.fields_tree
+            tree.delete(*tree.get_children())
+            self.available_field_ids = [fid for fid, _disp, _val in rows]
+            selected = self.selected_field_ids
+            insert = tree.insert
+            # Rows of plain strings skip Treeview.insert's option formatting and go
+            # to Tcl as-is; anything else keeps ttk's stringification
+            call, path = tree.tk.call, str(tree)
+            for fid, disp, val in rows:
+                values = ("✓" if fid in selected else "", disp, val)
+                if type(val) is str and type(disp) is str:
+                    call(path, "insert", "", "end", "-id", fid, "-values", values)
+                else:
+                    insert("", "end", iid=fid, values=values)
             self.log(f"Loaded {len(self.available_field_ids)} fields.")
-        threading.Thread(target=lambda: self._run_worker(worker, on_done), daemon=True).start()
+        self._root().submit(self._run_worker, worker, on_done)
 
     def _run_worker(self, worker, on_done):
         try:
@@ -572,7 +900,7 @@ class ConfigTab(ttk.Frame):
             rule_name = name_var.get().strip()
             if not rule_name:
                 continue
-            seq = [v.get().strip() for v in seq_vars if v.get().strip()]
+            seq = [s for v in seq_vars if (s := v.get().strip())]
             if len(seq) < 2:
                 continue
             trules.append({"name": rule_name, "sequence": seq})
@@ -581,7 +909,7 @@ class ConfigTab(ttk.Frame):
             "end": self.bh_end.get().strip(),
             "timezone": self.bh_tz.get().strip() or "UTC",
             "exclude_weekends": bool(self.bh_excl_wknd.get()),
-            "holidays": [h.strip() for h in self.bh_holidays.get().split(",") if h.strip()]
+            "holidays": [s for h in self.bh_holidays.get().split(",") if (s := h.strip())]
         }
         cfg = {
             "name": name,
@@ -606,11 +934,14 @@ class ConfigTab(ttk.Frame):
         ids_from_cfg = cfg.get("selected_field_ids")
         if not ids_from_cfg:
             ids_from_cfg = cfg.get("selected_fields", [])
+        previous = self.selected_field_ids
         self.selected_field_ids = set(ids_from_cfg)
 
-        for iid in self.fields_tree.get_children():
-            fid = iid
-            self.fields_tree.set(iid, "selected", "✓" if fid in self.selected_field_ids else "")
+        # Only rows whose tick actually changes need a Tk call
+        tree = self.fields_tree
+        rows = set(tree.get_children())
+        for fid in (previous ^ self.selected_field_ids) & rows:
+            tree.set(fid, "selected", "✓" if fid in self.selected_field_ids else "")
 
         for _ in list(getattr(self, "tr_rows", [])):
             _[2].destroy()
@@ -637,7 +968,7 @@ class ConfigTab(ttk.Frame):
         trules = []
         for name_var, seq_vars, _row in self.tr_rows:
             rule_name = name_var.get().strip()
-            seq = [v.get().strip() for v in seq_vars if v.get().strip()]
+            seq = [s for v in seq_vars if (s := v.get().strip())]
             if rule_name and len(seq) >= 2:
                 trules.append({"name": rule_name, "sequence": seq})
         return {
@@ -650,7 +981,7 @@ class ConfigTab(ttk.Frame):
                 "end": self.bh_end.get().strip(),
                 "timezone": self.bh_tz.get().strip() or "UTC",
                 "exclude_weekends": bool(self.bh_excl_wknd.get()),
-                "holidays": [h.strip() for h in self.bh_holidays.get().split(",") if h.strip()]
+                "holidays": [s for h in self.bh_holidays.get().split(",") if (s := h.strip())]
             }
         }
 
@@ -663,7 +994,8 @@ class JQLTab(ttk.Frame):
         self.config_tab = config_tab
         self.log = log_fn
         self.field_id_to_name = field_id_to_name
-        self.jql_manager = JQLManager()  # Initialize JQL manager
+        self._formatters = {}  # field id -> cell formatter, filled on first use
+        self.jql_manager = get_shared_manager()
         self._build_ui()
 
     def _build_ui(self):
@@ -726,14 +1058,14 @@ class JQLTab(ttk.Frame):
             return
         self.log(f"Searching JQL: {jql}")
         def worker():
-            keys, total = self.client.search_jql(jql, max_results=100, fields=["key"], expand_changelog=False)
+            keys, total = self.client.search_jql(jql, fields=["key"], expand_changelog=False)
             return keys, total
         def on_done(res):
             keys, total = res
             self.count_var.set(f"Matches: {total}")
             self.log(f"Found {total} issue(s).")
             self._last_keys = keys
-        threading.Thread(target=lambda: self._run_worker(worker, on_done), daemon=True).start()
+        self._root().submit(self._run_worker, worker, on_done)
 
     def export_csv(self):
         jql = self.jql_selector.get().strip()
@@ -750,14 +1082,11 @@ class JQLTab(ttk.Frame):
             return
         self.log("Starting export...")
         self.pb["value"] = 0
-        self.pb.update_idletasks()
 
-        def progress_cb(stage, done, total):
-            self.stage_var.set(stage)
-            self.pb["maximum"] = total if total else 1
-            self.pb["value"] = min(done, total) if total else done
+        progress_cb = _throttled_progress(self, self.stage_var, self.pb)
 
         def worker():
+            from export_csv import export_csv
             headers, row_iter = export_csv(
                 jira_client=self.client,
                 jql=jql,
@@ -765,14 +1094,22 @@ class JQLTab(ttk.Frame):
                 field_id_to_name=self.field_id_to_name,
                 format_field_fn=self._format_field,
                 business_hours_overlap=business_hours_overlap,
-                progress_cb=progress_cb
+                progress_cb=progress_cb,
+                business_hours_overlap_batch=business_hours_overlap_batch,
+                formatter_for=self._formatter_for
             )
-            with open(filepath, "w", newline="", encoding="utf-8") as f:
+            # Large buffer + writerows on 512-row chunks keeps write() calls and
+            # per-row overhead down; rows become plain lists in header order
+            with open(filepath, "w", newline="", encoding="utf-8", buffering=CSV_WRITE_BUFFER) as f:
                 import csv as _csv
-                writer = _csv.DictWriter(f, fieldnames=headers)
-                writer.writeheader()
-                for _row in row_iter():
-                    writer.writerow(_row)
+                writer = _csv.writer(f)
+                writer.writerow(headers)
+                rows = row_iter()
+                while True:
+                    chunk = [[_row.get(h, "") for h in headers] for _row in islice(rows, CSV_WRITE_BATCH)]
+                    if not chunk:
+                        break
+                    writer.writerows(chunk)
             return True
 
         def on_done(_):
@@ -780,7 +1117,7 @@ class JQLTab(ttk.Frame):
             self.log("Export completed.", "success")
             messagebox.showinfo("Done", "CSV export completed.")
 
-        threading.Thread(target=lambda: self._run_worker(worker, on_done), daemon=True).start()
+        self._root().submit(self._run_worker, worker, on_done)
 
     def export_json(self):
         jql = self.jql_selector.get().strip()
@@ -792,14 +1129,11 @@ class JQLTab(ttk.Frame):
             return
         self.log("Starting JSON export...")
         self.pb["value"] = 0
-        self.pb.update_idletasks()
 
-        def progress_cb(stage, done, total):
-            self.stage_var.set(stage)
-            self.pb["maximum"] = total if total else 1
-            self.pb["value"] = min(done, total) if total else done
+        progress_cb = _throttled_progress(self, self.stage_var, self.pb)
 
         def worker():
+            from export_json import export_json
             export_json(
                 jira_client=self.client,
                 jql=jql,
@@ -814,7 +1148,7 @@ class JQLTab(ttk.Frame):
             self.log("JSON export completed.", "success")
             messagebox.showinfo("Done", "JSON export completed.")
 
-        threading.Thread(target=lambda: self._run_worker(worker, on_done), daemon=True).start()
+        self._root().submit(self._run_worker, worker, on_done)
 
     def export_markdown(self):
         jql = self.jql_selector.get().strip()
@@ -826,14 +1160,11 @@ class JQLTab(ttk.Frame):
             return
         self.log("Starting Markdown export...")
         self.pb["value"] = 0
-        self.pb.update_idletasks()
 
-        def progress_cb(stage, done, total):
-            self.stage_var.set(stage)
-            self.pb["maximum"] = total if total else 1
-            self.pb["value"] = min(done, total) if total else done
+        progress_cb = _throttled_progress(self, self.stage_var, self.pb)
 
         def worker():
+            from export_json import export_markdown
             export_markdown(
                 jira_client=self.client,
                 jql=jql,
@@ -848,46 +1179,61 @@ class JQLTab(ttk.Frame):
             self.log("Markdown export completed.", "success")
             messagebox.showinfo("Done", "Markdown export completed.")
 
-        threading.Thread(target=lambda: self._run_worker(worker, on_done), daemon=True).start()
+        self._root().submit(self._run_worker, worker, on_done)
 
     def _parse_sprint_blob(self, s):
-        m = self.SPRINT_NAME_RE.search(s or "")
+        # Fast path for the usual "...,name=Sprint 7,..." blob; the regex is only
+        # needed when the first "name=" is empty and a later one must be found
+        text = s or ""
+        i = text.find("name=")
+        if i == -1:
+            return s
+        start = i + 5
+        end = len(text)
+        for stop in (text.find(",", start), text.find("]", start)):
+            if start <= stop < end:
+                end = stop
+        if end > start:
+            return text[start:end]
+        m = self.SPRINT_NAME_RE.search(text)
         return m.group(1) if m else s
 
     def _format_field(self, fid, val):
-        name = self.field_id_to_name.get(fid, fid)
-        if isinstance(val, list) and name.lower() == "sprint":
-            sprints = []
-            for s in val:
-                if isinstance(s, dict):
-                    nm = s.get("name") or s.get("id")
-                    if s.get("state"):
-                        nm = f"{nm} ({s['state']})"
-                    sprints.append(str(nm))
-                else:
-                    sprints.append(self._parse_sprint_blob(str(s)))
-            return " | ".join(sprints)
-        if name.lower() == "fix versions" and isinstance(val, list):
-            return ", ".join([v.get("name") for v in val if isinstance(v, dict) and v.get("name")])
-        if name.lower() == "affects versions" and isinstance(val, list):
-            return ", ".join([v.get("name") for v in val if isinstance(v, dict) and v.get("name")])
-        if name.lower() == "components" and isinstance(val, list):
-            return ", ".join([v.get("name") for v in val if isinstance(v, dict) and v.get("name")])
-        if isinstance(val, list):
-            items = []
-            for x in val:
-                if isinstance(x, dict):
-                    items.append(x.get("displayName") or x.get("name") or x.get("value") or x.get("key") or str(x))
-                else:
-                    items.append(str(x))
-            return ", ".join(items)
-        if isinstance(val, dict):
-            if "displayName" in val: return val["displayName"]
-            if "name" in val: return val["name"]
-            if "value" in val: return val["value"]
-            if "key" in val: return val["key"]
-            return json.dumps(val, ensure_ascii=False)
-        return "" if val is None else str(val)
+        fmt = self._formatters.get(fid)
+        if fmt is None:
+            fmt = self._formatters[fid] = self._formatter_for(fid)
+        return fmt(val)
+
+    def _formatter_for(self, fid):
+        # The field name decides the formatter, so it is looked up once per field, not per cell
+        name = self.field_id_to_name.get(fid, fid).lower()
+        if name == "sprint":
+            return self._format_sprint
+        if name in ("fix versions", "affects versions", "components"):
+            return self._format_name_list
+        return self._format_generic
+
+    def _format_sprint(self, val):
+        if not isinstance(val, list):
+            return self._format_generic(val)
+        sprints = []
+        for s in val:
+            if isinstance(s, dict):
+                nm = s.get("name") or s.get("id")
+                if s.get("state"):
+                    nm = f"{nm} ({s['state']})"
+                sprints.append(str(nm))
+            else:
+                sprints.append(self._parse_sprint_blob(str(s)))
+        return " | ".join(sprints)
+
+    def _format_name_list(self, val):
+        if not isinstance(val, list):
+            return self._format_generic(val)
+        return ", ".join([n for v in val if isinstance(v, dict) and (n := v.get("name"))])
+
+    def _format_generic(self, val):
+        return _CELL_BY_TYPE.get(type(val), _cell_other)(val)
 
     def _run_worker(self, worker, on_done):
         try:
@@ -963,8 +1309,7 @@ class ConnectionManagerWindow(tk.Toplevel):
     def refresh_list(self):
         """Refresh the connections list"""
         # Clear existing items
-        for item in self.tree.get_children():
-            self.tree.delete(item)
+        self.tree.delete(*self.tree.get_children())
             
         # Load and display connections
         connections = load_saved_connections()
@@ -1004,8 +1349,7 @@ class ConnectionManagerWindow(tk.Toplevel):
             connections = load_saved_connections()
             if name in connections:
                 del connections[name]
-                with open(CONNECTIONS_PATH, "w", encoding="utf-8") as f:
-                    json.dump(connections, f, indent=2)
+                _save_connections(connections)
                 self.log(f"Deleted saved connection '{name}'.")
                 self.refresh_list()
             else:
@@ -1030,6 +1374,7 @@ class ConnectionManagerWindow(tk.Toplevel):
         self.log(f"Testing connection '{name}'...")
         
         def test_connection():
+            from jira_client import JiraClient
             client = JiraClient(conn["base_url"], conn["email"], conn["api_token"], log_fn=self.log)
             return client.test_connection()
             
@@ -1041,7 +1386,7 @@ class ConnectionManagerWindow(tk.Toplevel):
                 self.log(f"Connection '{name}' test failed.", "err")
                 messagebox.showerror("Test Failed", f"Connection '{name}' failed. Please check credentials.")
                 
-        threading.Thread(target=lambda: self._run_worker(test_connection, on_done), daemon=True).start()
+        self._root().submit(self._run_worker, test_connection, on_done)
     
     def _run_worker(self, worker, on_done):
         try:
@@ -1052,6 +1397,10 @@ class ConnectionManagerWindow(tk.Toplevel):
         self.after(0, lambda: on_done(result))
 
 
+# Sprint list ordering and markers, by sprint state
+_SPRINT_STATE_ORDER = {'active': 0, 'closed': 1, 'future': 2}
+_SPRINT_STATE_EMOJI = {'active': '🔄', 'closed': '✅', 'future': '📅'}
+
 class SprintAnalysisTab(ttk.Frame):
     def __init__(self, master, jira_client: JiraClient, log_fn, field_id_to_name):
         super().__init__(master)
@@ -1060,6 +1409,10 @@ class SprintAnalysisTab(ttk.Frame):
         self.field_id_to_name = field_id_to_name
         self.boards = []
         self.sprints = []
+        self._boards_by_id = {}
+        self._sprints_by_id = {}
+        self._board_combo_ids = []  # board id per board_combo entry
+        self._sprint_combo_ids = []  # sprint id per sprint_combo entry
         self.selected_board = None
         self.selected_sprint = None
         self._build_ui()
@@ -1166,6 +1519,8 @@ class SprintAnalysisTab(ttk.Frame):
         def on_done(success):
             self.stage_var.set("Ready")
             if success:
+                self._boards_by_id = {board['id']: board for board in self.boards}
+                self._board_combo_ids = [board['id'] for board in self.boards]
                 board_names = [f"{board['name']} (ID: {board['id']})" for board in self.boards]
                 self.board_combo['values'] = board_names
                 self.log(f"Loaded {len(self.boards)} boards.")
@@ -1173,20 +1528,19 @@ class SprintAnalysisTab(ttk.Frame):
                 self.log("Failed to load boards.", "error")
         
         self.stage_var.set("Loading boards...")
-        threading.Thread(target=lambda: self._run_worker(worker, on_done), daemon=True).start()
+        self._root().submit(self._run_worker, worker, on_done)
 
     def _on_board_selected(self, event=None):
         """Handle board selection"""
-        selection = self.board_var.get()
-        if not selection:
+        idx = self.board_combo.current()
+        if idx < 0:
             return
         
-        # Extract board ID from selection
         try:
-            board_id = int(selection.split("(ID: ")[1].split(")")[0])
-            self.selected_board = next(board for board in self.boards if board['id'] == board_id)
+            board_id = self._board_combo_ids[idx]
+            self.selected_board = self._boards_by_id[board_id]
             self._load_sprints(board_id)
-        except (ValueError, IndexError, StopIteration):
+        except (ValueError, IndexError, KeyError):
             self.log("Error parsing board selection", "error")
 
     def _load_sprints(self, board_id):
@@ -1203,12 +1557,13 @@ class SprintAnalysisTab(ttk.Frame):
             self.stage_var.set("Ready")
             if success:
                 # Sort sprints by state (active first, then closed, then future) and name
-                sprint_order = {'active': 0, 'closed': 1, 'future': 2}
-                self.sprints.sort(key=lambda s: (sprint_order.get(s.get('state', 'future'), 3), s.get('name', '')))
+                self.sprints.sort(key=lambda s: (_SPRINT_STATE_ORDER.get(s.get('state', 'future'), 3), s.get('name', '')))
+                self._sprints_by_id = {sprint['id']: sprint for sprint in self.sprints}
+                self._sprint_combo_ids = [sprint['id'] for sprint in self.sprints]
                 
                 sprint_names = []
                 for sprint in self.sprints:
-                    state_emoji = {'active': '🔄', 'closed': '✅', 'future': '📅'}.get(sprint.get('state'), '❓')
+                    state_emoji = _SPRINT_STATE_EMOJI.get(sprint.get('state'), '❓')
                     sprint_names.append(f"{state_emoji} {sprint['name']} (ID: {sprint['id']})")
                 
                 self.sprint_combo['values'] = sprint_names
@@ -1220,29 +1575,29 @@ class SprintAnalysisTab(ttk.Frame):
                 self.log("Failed to load sprints.", "error")
         
         self.stage_var.set("Loading sprints...")
-        threading.Thread(target=lambda: self._run_worker(worker, on_done), daemon=True).start()
+        self._root().submit(self._run_worker, worker, on_done)
 
     def _on_sprint_selected(self, event=None):
         """Handle sprint selection"""
-        selection = self.sprint_var.get()
-        if not selection:
+        idx = self.sprint_combo.current()
+        if idx < 0:
             return
         
-        # Extract sprint ID from selection
         try:
-            sprint_id = int(selection.split("(ID: ")[1].split(")")[0])
-            self.selected_sprint = next(sprint for sprint in self.sprints if sprint['id'] == sprint_id)
+            sprint_id = self._sprint_combo_ids[idx]
+            self.selected_sprint = self._sprints_by_id[sprint_id]
             
             # Update sprint info display
             sprint = self.selected_sprint
             info_parts = [f"State: {sprint.get('state', 'Unknown')}"]
             
+            from export_csv import parse_jira_datetime
             if sprint.get('startDate'):
-                start_date = dtparser.parse(sprint['startDate']).strftime('%Y-%m-%d')
+                start_date = parse_jira_datetime(sprint['startDate']).strftime('%Y-%m-%d')
                 info_parts.append(f"Start: {start_date}")
             
             if sprint.get('endDate'):
-                end_date = dtparser.parse(sprint['endDate']).strftime('%Y-%m-%d')
+                end_date = parse_jira_datetime(sprint['endDate']).strftime('%Y-%m-%d')
                 info_parts.append(f"End: {end_date}")
             
             if sprint.get('goal'):
@@ -1251,7 +1606,7 @@ class SprintAnalysisTab(ttk.Frame):
             self.sprint_info_var.set(" | ".join(info_parts))
             self.analyze_button.config(state="normal")
             
-        except (ValueError, IndexError, StopIteration):
+        except (ValueError, IndexError, KeyError):
             self.log("Error parsing sprint selection", "error")
 
     def analyze_sprint(self):
@@ -1261,20 +1616,16 @@ class SprintAnalysisTab(ttk.Frame):
             return
         
         # Clear previous results
-        for item in self.tree.get_children():
-            self.tree.delete(item)
+        self.tree.delete(*self.tree.get_children())
         
         self.log("Starting sprint analysis...")
         self.pb["value"] = 0
-        self.pb.update_idletasks()
 
-        def progress_cb(stage, done, total):
-            self.stage_var.set(stage)
-            self.pb["maximum"] = total if total else 1
-            self.pb["value"] = min(done, total) if total else done
+        progress_cb = _throttled_progress(self, self.stage_var, self.pb)
 
         def worker():
             try:
+                from sprint_analysis import analyze_sprint_patterns_by_sprint
                 headers, row_iter = analyze_sprint_patterns_by_sprint(
                     jira_client=self.client,
                     sprint_id=self.selected_sprint['id'],
@@ -1298,7 +1649,7 @@ class SprintAnalysisTab(ttk.Frame):
             else:
                 self.log("Sprint analysis failed.", "error")
 
-        threading.Thread(target=lambda: self._run_worker(worker, on_done), daemon=True).start()
+        self._root().submit(self._run_worker, worker, on_done)
 
     def _display_results(self):
         """Display analysis results in the preview tree"""
@@ -1331,7 +1682,7 @@ class SprintAnalysisTab(ttk.Frame):
         if filepath:
             try:
                 import csv
-                with open(filepath, "w", newline="", encoding="utf-8") as f:
+                with open(filepath, "w", newline="", encoding="utf-8", buffering=CSV_WRITE_BUFFER) as f:
                     writer = csv.DictWriter(f, fieldnames=self.last_headers)
                     writer.writeheader()
                     writer.writerows(self.last_results)
@@ -1352,6 +1703,46 @@ class SprintAnalysisTab(ttk.Frame):
         self.after(0, lambda: on_done(result))
 
 
+class _DaemonPool:
+    """
+    Fixed set of daemon worker threads fed from a queue. Unlike ThreadPoolExecutor,
+    whose workers are joined at interpreter exit, a job still running when the
+    window closes doesn't keep the process alive.
+    """
+    def __init__(self, workers, name):
+        self._jobs = SimpleQueue()
+        self._closed = False
+        for i in range(workers):
+            threading.Thread(target=self._work, name=f"{name}-{i}", daemon=True).start()
+
+    def submit(self, fn, *args):
+        fut = Future()
+        if self._closed:
+            fut.cancel()
+        else:
+            self._jobs.put((fut, fn, args))
+        return fut
+
+    def shutdown(self):
+        """Refuse new jobs and cancel the queued ones"""
+        self._closed = True
+        while True:
+            try:
+                fut, _fn, _args = self._jobs.get_nowait()
+            except Empty:
+                break
+            fut.cancel()
+
+    def _work(self):
+        while True:
+            fut, fn, args = self._jobs.get()
+            if not fut.set_running_or_notify_cancel():
+                continue
+            try:
+                fut.set_result(fn(*args))
+            except BaseException as e:
+                fut.set_exception(e)
+
 class MainWindow(tk.Tk):
     def __init__(self):
         super().__init__()
@@ -1379,7 +1770,21 @@ class MainWindow(tk.Tk):
         self._jql_tab = None
         self._current_connection_info = None
 
+        # Every tab and dialog runs its background jobs here via self._root().submit
+        self._executor = _DaemonPool(UI_WORKERS, "ui-worker")
+        self.protocol("WM_DELETE_WINDOW", self.on_close)
+
         self.after(100, self.open_login)
+        self.after_idle(lambda: self.submit(_preload_deferred_modules))
+
+    def submit(self, fn, *args):
+        """Run fn(*args) on the shared worker pool and return its Future"""
+        return self._executor.submit(fn, *args)
+
+    def on_close(self):
+        """Drop queued jobs and close the window; a job still running dies with the process"""
+        self._executor.shutdown()
+        self.destroy()
 
     def _setup_theme(self):
         """Configure modern theme and styling"""
@@ -1496,6 +1901,7 @@ class MainWindow(tk.Tk):
         self.log("Reconnecting to Jira instance...")
         
         # Try to reconnect with saved credentials
+        from jira_client import JiraClient
         client = JiraClient(
             self._current_connection_info['base_url'],
             self._current_connection_info['email'], 
@@ -1516,7 +1922,7 @@ class MainWindow(tk.Tk):
                 self.log("Reconnection failed. Please check your connection.", "err")
                 messagebox.showerror("Reconnection Failed", "Could not reconnect to Jira. Please switch instance or check your connection.")
         
-        threading.Thread(target=test_and_reconnect, daemon=True).start()
+        self.submit(test_and_reconnect)
 
     def manage_connections(self):
         """Open the connection management dialog"""
@@ -1552,7 +1958,8 @@ Connected: {'Yes' if self._client else 'No'}"""
         self._jql_tab = None
 
     def log(self, msg, level="info"):
-        print(msg)
+        if LOG_TO_STDOUT:
+            print(msg)
         self.log_console.write(msg, level)
 
     def open_login(self):
@@ -1574,8 +1981,8 @@ Connected: {'Yes' if self._client else 'No'}"""
         # Store connection info for reconnection
         self._current_connection_info = {
             'base_url': client.base_url,
-            'email': client.session.auth[0],  # Get email from session auth
-            'api_token': client.session.auth[1]  # Get token from session auth
+            'email': client.auth[0],
+            'api_token': client.auth[1]
         }
         
         # Update window title to show connected instance
@@ -1605,6 +2012,7 @@ Connected: {'Yes' if self._client else 'No'}"""
                                log_fn=self.log, field_id_to_name=field_id_to_name)
         self._sprint_tab = SprintAnalysisTab(self.nb, jira_client=self._client, 
                                            log_fn=self.log, field_id_to_name=field_id_to_name)
+        from timeline_report_ui import TimelineReportTab
         self._timeline_tab = TimelineReportTab(self.nb, jira_client=self._client, 
                                              log_fn=self.log, field_id_to_name=field_id_to_name)
         self.nb.add(self._config_tab, text="Configuration")
@@ -0,0 +1,26 @@
+"""
+Progress Throttle
+Rate-limits progress callbacks from worker threads before they reach Tk widgets.
+"""
+
+from time import monotonic
+
+PROGRESS_INTERVAL = 1 / 30  # seconds between progress bar updates from a worker
+
+def throttled_progress(widget, apply):
+    """
+    Build a progress_cb(stage, done, total) for worker threads that hands
+    apply(stage, done, total) to the Tk thread via widget.after at most once per
+    PROGRESS_INTERVAL; stage changes and the final update always go through.
+    """
+    last = {"at": 0.0, "stage": None}
+
+    def progress_cb(stage, done, total):
+        now = monotonic()
+        if now - last["at"] < PROGRESS_INTERVAL and stage == last["stage"] and done != total:
+            return
+        last["at"] = now
+        last["stage"] = stage
+        widget.after(0, apply, stage, done, total)
+
+    return progress_cb
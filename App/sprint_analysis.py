@@ -2,9 +2,9 @@ import csv
 import threading
 from queue import Queue
 from datetime import datetime, timedelta
-from dateutil import parser as dtparser, tz
+from dateutil import tz
 
-from export_csv import extract_status_changes
+from export_csv import extract_status_changes, parse_jira_datetime
 
 CONCURRENT_WORKERS = 12
 
@@ -52,8 +52,8 @@ def analyze_sprint_patterns(jira_client, jql, sprint_start_str, sprint_end_str,
     
     # Parse sprint dates
     try:
-        sprint_start = dtparser.parse(sprint_start_str)
-        sprint_end = dtparser.parse(sprint_end_str)
+        sprint_start = parse_jira_datetime(sprint_start_str)
+        sprint_end = parse_jira_datetime(sprint_end_str)
         
         # Ensure dates are timezone-aware (use UTC if no timezone)
         if sprint_start.tzinfo is None:
@@ -73,7 +73,7 @@ def analyze_sprint_patterns(jira_client, jql, sprint_start_str, sprint_end_str,
     
     # Get issue keys first
     progress_cb("Getting issue list...", 0, 1)
-    keys, _ = jira_client.search_jql(jql, max_results=100, fields=["key"], expand_changelog=False)
+    keys, _ = jira_client.search_jql(jql, fields=["key"], expand_changelog=False)
     total = len(keys)
     
     if total == 0:
@@ -206,8 +206,8 @@ def analyze_sprint_patterns_by_sprint(jira_client, sprint_id, progress_cb):
     
     # Parse sprint dates
     try:
-        sprint_start = dtparser.parse(sprint_start_str)
-        sprint_end = dtparser.parse(sprint_end_str)
+        sprint_start = parse_jira_datetime(sprint_start_str)
+        sprint_end = parse_jira_datetime(sprint_end_str)
         
         # Ensure dates are timezone-aware (use existing timezone or UTC)
         if sprint_start.tzinfo is None:
@@ -315,8 +315,8 @@ def analyze_sprint_patterns_by_sprint(jira_client, sprint_id, progress_cb):
     
     # Parse sprint dates
     try:
-        sprint_start = dtparser.parse(sprint_start_str)
-        sprint_end = dtparser.parse(sprint_end_str)
+        sprint_start = parse_jira_datetime(sprint_start_str)
+        sprint_end = parse_jira_datetime(sprint_end_str)
         
         # Ensure dates are timezone-aware (use UTC if no timezone)
         if sprint_start.tzinfo is None:
@@ -336,7 +336,7 @@ def analyze_sprint_patterns_by_sprint(jira_client, sprint_id, progress_cb):
     
     # Get issue keys first
     progress_cb("Getting issue list...", 0, 1)
-    keys, _ = jira_client.search_jql(jql, max_results=100, fields=["key"], expand_changelog=False)
+    keys, _ = jira_client.search_jql(jql, fields=["key"], expand_changelog=False)
     total = len(keys)
     
     if total == 0:
@@ -5,18 +5,21 @@ This can be used as a reference or integrated into the main application.
 
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
-import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 
 from sprint_analysis import analyze_sprint_patterns
 from jira_client import JiraClient
 from jql_selector_widget import JQLSelectorWidget
-from jql_manager import JQLManager
+from jql_manager import get_shared_manager
+
+# Used when the window runs standalone; inside the main app the MainWindow pool is shared
+_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="sprint-analysis")
 
 class SprintAnalysisWindow:
     def __init__(self, parent=None, jira_client=None):
         self.jira_client = jira_client
-        self.jql_manager = JQLManager()  # Initialize JQL manager
+        self.jql_manager = get_shared_manager()
         
         # Create window
         if parent:
@@ -141,12 +144,13 @@ class SprintAnalysisWindow:
         self.end_date_var.set(end_date.strftime("%Y-%m-%d"))
     
     def progress_callback(self, stage, done, total):
-        """Progress callback for analysis"""
+        """Progress callback for analysis; called from the worker thread"""
+        self.window.after(0, self._apply_progress, stage, done, total)
+
+    def _apply_progress(self, stage, done, total):
         self.progress_var.set(f"{stage} - {done}/{total}")
         if total > 0:
-            self.progress_bar["maximum"] = total
-            self.progress_bar["value"] = done
-        self.window.update_idletasks()
+            self.progress_bar.configure(maximum=total, value=done)
     
     def run_analysis(self):
         """Run sprint pattern analysis"""
@@ -163,8 +167,7 @@ class SprintAnalysisWindow:
             return
         
         # Clear previous results
-        for item in self.tree.get_children():
-            self.tree.delete(item)
+        self.tree.delete(*self.tree.get_children())
         
         def worker():
             try:
@@ -188,7 +191,8 @@ class SprintAnalysisWindow:
                 self.window.after(0, lambda: messagebox.showerror("Error", str(e)))
                 return False
         
-        threading.Thread(target=worker, daemon=True).start()
+        submit = getattr(self.window._root(), "submit", _executor.submit)
+        submit(worker)
     
     def display_results(self, results):
         """Display results in the treeview"""
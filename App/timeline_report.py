@@ -6,7 +6,7 @@ Creates visual timeline reports showing status transitions over time.
 import threading
 from queue import Queue
 from datetime import datetime, timedelta
-from dateutil import parser as dtparser, tz
+from dateutil import tz
 from collections import defaultdict
 import html
 
@@ -107,7 +107,7 @@ def build_timeline_data(jira_client, jql, status_order, start_date=None, end_dat
     
     # Get issue keys
     log("Fetching issues...", 0, 1)
-    keys, _ = jira_client.search_jql(jql, max_results=1000, fields=["key"], expand_changelog=False)
+    keys, _ = jira_client.search_jql(jql, fields=["key"], expand_changelog=False)
     total = len(keys)
     
     if total == 0:
@@ -5,7 +5,6 @@ Provides interface for configuring and generating timeline reports.
 
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox, colorchooser
-import threading
 import json
 import os
 import re
@@ -13,7 +12,8 @@ from datetime import datetime
 
 from timeline_report import build_timeline_data, generate_html_report
 from jql_selector_widget import JQLSelectorWidget
-from jql_manager import JQLManager
+from jql_manager import get_shared_manager
+from progress_throttle import throttled_progress
 
 class TimelineReportTab(ttk.Frame):
     def __init__(self, master, jira_client, log_fn, field_id_to_name):
@@ -26,7 +26,7 @@ class TimelineReportTab(ttk.Frame):
         self.statuses = []
         self.status_widgets = []  # Track dynamically created widgets
         self.timeline_data = None
-        self.jql_manager = JQLManager()  # Initialize JQL manager
+        self.jql_manager = get_shared_manager()
         self.last_config_file = os.path.join(os.path.dirname(__file__), 'timeline_last_config.json')
         self.saved_configs_dir = os.path.join(os.path.dirname(__file__), 'saved_timeline_configs')
         
@@ -182,7 +182,7 @@ class TimelineReportTab(ttk.Frame):
                 self.log("Failed to load projects", "error")
         
         self.progress_var.set("Loading projects...")
-        threading.Thread(target=lambda: self._run_worker(worker, on_done), daemon=True).start()
+        self._root().submit(self._run_worker, worker, on_done)
     
     def _on_project_selected(self, event=None):
         """Handle project selection"""
@@ -204,7 +204,7 @@ class TimelineReportTab(ttk.Frame):
         
         def worker():
             try:
-                keys, total = self.client.search_jql(jql, max_results=10, fields=["key"], expand_changelog=False)
+                keys, total = self.client.search_jql(jql, fields=["key"], expand_changelog=False)
                 return keys, total
             except Exception as e:
                 return None, str(e)
@@ -221,7 +221,7 @@ class TimelineReportTab(ttk.Frame):
                 self.log("JQL query failed", "error")
         
         self.progress_var.set("Testing query...")
-        threading.Thread(target=lambda: self._run_worker(worker, on_done), daemon=True).start()
+        self._root().submit(self._run_worker, worker, on_done)
     
     def _load_statuses(self):
         """Load statuses for the selected project"""
@@ -255,7 +255,7 @@ class TimelineReportTab(ttk.Frame):
                 self.log("Failed to load statuses", "error")
         
         self.progress_var.set("Loading statuses...")
-        threading.Thread(target=lambda: self._run_worker(worker, on_done), daemon=True).start()
+        self._root().submit(self._run_worker, worker, on_done)
     
     def _build_status_list(self):
         """Build the status configuration list"""
@@ -429,12 +429,14 @@ class TimelineReportTab(ttk.Frame):
             except:
                 pass
         
-        def progress_callback(stage, done, total):
+        def apply_progress(stage, done, total):
             if total > 0:
                 pct = (done / total) * 100
                 self.progress_bar['value'] = pct
             self.progress_var.set(f"{stage} ({done}/{total})")
-            self.update_idletasks()
+
+        # Called from the worker thread; updates reach the Tk thread at a capped rate
+        progress_callback = throttled_progress(self, apply_progress)
         
         def worker():
             try:
@@ -494,7 +496,7 @@ class TimelineReportTab(ttk.Frame):
         
         self.log("Generating timeline report...")
         self.progress_var.set("Starting...")
-        threading.Thread(target=lambda: self._run_worker(worker, on_done), daemon=True).start()
+        self._root().submit(self._run_worker, worker, on_done)
     
 
     
@@ -628,7 +630,7 @@ class TimelineReportTab(ttk.Frame):
                 self._load_statuses_from_config(config)
         
         self.progress_var.set("Loading statuses...")
-        threading.Thread(target=lambda: self._run_worker(worker, on_done), daemon=True).start()
+        self._root().submit(self._run_worker, worker, on_done)
     
     def _delete_saved_config(self):
         """Delete the selected saved configuration"""
@@ -0,0 +1,62 @@
+import json
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "App"))
+
+from export_json import export_json
+
+
+class _Client:
+    """Minimal JiraClient stand-in whose batch search rejects the batch containing bad_key"""
+    base_url = "https://jira.example"
+
+    def __init__(self, keys, bad_key):
+        self.keys = keys
+        self.bad_key = bad_key
+        self.single_fetches = []
+
+    def search_jql(self, jql, max_results=None, fields=None, expand_changelog=False):
+        return list(self.keys), len(self.keys)
+
+    def get_issues_by_keys(self, keys, fields=None, expand_changelog=True):
+        if self.bad_key in keys:
+            raise RuntimeError("400 Bad Request: An issue with key '%s' does not exist" % self.bad_key)
+        return {key: self._issue(key) for key in keys}
+
+    def get_issue(self, key, expand_changelog=True):
+        self.single_fetches.append(key)
+        return self._issue(key)
+
+    def get_comments_bulk(self, keys, max_workers=10):
+        return {key: [] for key in keys}
+
+    def get_all_comments(self, key):
+        return []
+
+    def _issue(self, key):
+        return {
+            "key": key,
+            "id": key.split("-")[1],
+            "self": f"{self.base_url}/rest/api/3/issue/{key}",
+            "fields": {"summary": f"Summary {key}", "comment": {"comments": [], "total": 0}},
+            "changelog": {"histories": []},
+        }
+
+
+class ExportJsonBatchFallbackTest(unittest.TestCase):
+    def test_failed_batch_search_falls_back_to_single_issues(self):
+        keys = ["PRJ-1", "PRJ-2", "PRJ-3"]
+        client = _Client(keys, bad_key="PRJ-2")
+        with tempfile.TemporaryDirectory() as folder:
+            export_json(client, "project = PRJ", {"summary": "Summary"}, folder, lambda *a: None)
+            self.assertEqual(sorted(os.listdir(folder)), [f"{key}.json" for key in keys])
+            with open(os.path.join(folder, "PRJ-3.json"), encoding="utf-8") as f:
+                self.assertEqual(json.load(f)["fields"]["Summary"], "Summary PRJ-3")
+        self.assertEqual(sorted(client.single_fetches), keys)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,49 @@
+import os
+import sys
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest import mock
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "App"))
+
+from jira_client import JiraClient
+
+
+class _ProxyHandler(BaseHTTPRequestHandler):
+    """Answers every request itself and records the request line it was sent"""
+    protocol_version = "HTTP/1.1"
+    seen = []
+
+    def do_GET(self):
+        self.seen.append(self.path)
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", "2")
+        self.end_headers()
+        self.wfile.write(b"{}")
+
+    def log_message(self, *args):
+        pass
+
+
+class EnvironmentProxyTest(unittest.TestCase):
+    def setUp(self):
+        _ProxyHandler.seen = []
+        self.proxy = ThreadingHTTPServer(("127.0.0.1", 0), _ProxyHandler)
+        threading.Thread(target=self.proxy.serve_forever, daemon=True).start()
+        self.addCleanup(self.proxy.server_close)
+        self.addCleanup(self.proxy.shutdown)
+
+    def test_requests_go_through_the_environment_proxy(self):
+        proxy_url = f"http://127.0.0.1:{self.proxy.server_address[1]}"
+        env = {"HTTP_PROXY": proxy_url, "http_proxy": proxy_url, "NO_PROXY": "", "no_proxy": ""}
+        with mock.patch.dict(os.environ, env):
+            client = JiraClient("http://jira.invalid", "user@example.com", "token")
+            self.assertTrue(client.test_connection())
+        # A proxied request carries the absolute target URL
+        self.assertEqual(_ProxyHandler.seen, ["http://jira.invalid/rest/api/3/myself"])
+
+
+if __name__ == "__main__":
+    unittest.main()